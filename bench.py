@@ -0,0 +1,235 @@
+"""Scaling benchmarks for the dashboard data pipeline.
+
+For each dataset size a synthetic dataset is generated, written to Parquet
+and pushed through the same functions the dashboard uses: loading and
+preprocessing, get_aggregated_data for every sidebar filter combination
+(the reference pipeline, sampled on large datasets, and the precomputed
+cube), the dashboard's parallel startup precompute, date-range queries on
+the prefix-sum index, get_trend_data and the multi-series trend engine per
+region, and construction plus serialization of the map, gap and trend
+figures. With --engines, alternative backends run the same sampled filters
+(and the trend where they implement it) and are checked against the pandas
+results. Wall time and peak traced memory are recorded per stage (peak
+memory from a separate traced run) and written as JSON so runs can be
+diffed for regressions.
+
+    python bench.py --sizes 10k 1m --output bench_results.json
+    python bench.py --sizes 10m --engines duckdb polars --no-memory
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import pandas as pd
+
+import datastore
+import engine
+import figures
+import precompute
+import ranges
+import synthetic_data
+
+# Rows = nscs x periods x 4 frameworks
+SIZES = {
+    '10k': dict(nscs=100, months=24, daily=False),    # ~9.6K rows
+    '1m': dict(nscs=140, months=60, daily=True),      # ~1.0M rows
+    '10m': dict(nscs=700, months=120, daily=True),    # ~10.2M rows
+}
+DEFAULT_REFERENCE_SAMPLE = 60
+
+
+class Stage:
+    """Runs a benchmark stage, returning (result, {'seconds', 'peak_bytes'}).
+
+    tracemalloc slows allocation-heavy pandas code several-fold, so peak
+    memory comes from a second, traced run rather than the timed one.
+    """
+    def __init__(self, track_memory):
+        self.track_memory = track_memory
+
+    def __call__(self, fn, *args, **kwargs):
+        started = time.perf_counter()
+        result = fn(*args, **kwargs)
+        seconds = time.perf_counter() - started
+        peak = None
+        if self.track_memory:
+            tracemalloc.start()
+            fn(*args, **kwargs)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        return result, {'seconds': seconds, 'peak_bytes': peak}
+
+
+def filter_combinations(df):
+    """Every (year, quarter, month, region) the sidebar can produce."""
+    regions = ['All'] + sorted(df['Region'].astype(str).unique().tolist())
+    combos = []
+    for year in sorted(df['Year'].unique().tolist(), reverse=True):
+        months = [engine.MONTH_NAMES[m - 1] for m in sorted(df.loc[df['Year'] == year, 'Month'].unique().tolist())]
+        periods = [('All', 'All')] + [('All', m) for m in months]
+        for quarter in range(1, 5):
+            q_months = [m for m in months if (engine.MONTH_NAMES.index(m)) // 3 + 1 == quarter]
+            periods += [(str(quarter), 'All')] + [(str(quarter), m) for m in q_months]
+        combos += [(year, q, m, r) for q, m in periods for r in regions]
+    return combos
+
+
+def _latency_summary(samples):
+    samples = sorted(samples)
+    return {
+        'calls': len(samples),
+        'total_seconds': sum(samples),
+        'p50_ms': statistics.median(samples) * 1000,
+        'p95_ms': samples[min(len(samples) - 1, int(0.95 * len(samples)))] * 1000,
+        'max_ms': samples[-1] * 1000,
+    }
+
+
+def _timed_calls(fn, args_list):
+    samples = []
+    for args in args_list:
+        started = time.perf_counter()
+        fn(*args)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+def _engine_stage(name, path, df, sampled, stage):
+    # Alternative backend over the same sampled filters, checked against the reference
+    backend = engine.open_backend(name, path)
+    aggregate = backend.get_aggregated_data
+    samples, result = stage(_timed_calls, aggregate, sampled)
+    result.update(_latency_summary(samples))
+    mismatches = [
+        c for c in sampled
+        if not engine.aggregates_match(engine.get_aggregated_data(df, *c), aggregate(*c))[0]
+    ]
+    result['mismatches'] = len(mismatches)
+    result['mismatch_examples'] = [list(c) for c in mismatches[:5]]
+    if hasattr(backend, 'get_trend_data'):
+        regions = sorted({c[3] for c in sampled})
+        samples, result['trend'] = stage(_timed_calls, backend.get_trend_data, [(r,) for r in regions])
+        result['trend'].update(_latency_summary(samples))
+        result['trend']['mismatches'] = sum(
+            not engine.trends_match(engine.get_trend_data(df, r), backend.get_trend_data(r))[0] for r in regions
+        )
+    backend.close()
+    return result
+
+
+def run_size(label, params, workdir, stage, reference_sample, engines=()):
+    results = {'params': params}
+
+    raw, results['generate'] = stage(synthetic_data.generate_dataset, **params)
+    results['rows'] = len(raw)
+    path = os.path.join(workdir, f"bench_{label}.parquet")
+    _, results['write_parquet'] = stage(datastore.write_dataset, raw, path)
+    del raw
+
+    df, results['load_and_process'] = stage(
+        lambda: engine.preprocess_data(datastore.read_dataset(path, columns=engine.DATASET_COLUMNS))
+    )
+    results['memory_footprint_bytes'] = engine.memory_footprint(df)['total_bytes']
+
+    combos = filter_combinations(df)
+    results['filter_combinations'] = len(combos)
+
+    # Reference pipeline: evenly spaced sample on large datasets
+    step = max(1, len(combos) // reference_sample) if reference_sample else 1
+    sampled = combos[::step]
+    samples, results['aggregated_reference'] = stage(
+        _timed_calls, lambda *c: engine.get_aggregated_data(df, *c), sampled
+    )
+    results['aggregated_reference'].update(_latency_summary(samples))
+    results['aggregated_reference']['estimated_all_combinations_seconds'] = (
+        statistics.mean(samples) * len(combos)
+    )
+
+    for name in engines:
+        results[f'aggregated_{name}'] = _engine_stage(name, path, df, sampled, stage)
+
+    cube, results['cube_build'] = stage(engine.build_aggregation_cube, df)
+    results['cube_build']['entries'] = len(cube)
+    # What the dashboard runs at startup: cube plus monthly trends, on the process pool
+    _, results['startup_precompute'] = stage(precompute.precompute, df)
+    results['startup_precompute']['workers'] = precompute.precompute_workers()
+    samples, results['aggregated_cube'] = stage(
+        _timed_calls, lambda *c: engine.lookup_aggregated_data(cube, *c), combos
+    )
+    results['aggregated_cube'].update(_latency_summary(samples))
+
+    # Trailing windows of every length from the latest month, answered from prefix sums
+    index, results['range_index_build'] = stage(ranges.RangeIndex, df)
+    windows = [(index.last - length + 1, index.last) for length in (1, 3, 6, 12, 24)]
+    samples, results['range_query'] = stage(_timed_calls, index.query, windows)
+    results['range_query'].update(_latency_summary(samples))
+
+    regions = sorted({c[3] for c in combos})
+    samples, results['trend'] = stage(_timed_calls, lambda r: engine.get_trend_data(df, r), [(r,) for r in regions])
+    results['trend'].update(_latency_summary(samples))
+
+    freq = 'D' if params.get('daily') else 'M'
+    samples, results['trend_series'] = stage(
+        _timed_calls, lambda r: engine.build_trend_series(df, r, freq), [(r,) for r in regions]
+    )
+    results['trend_series'].update(_latency_summary(samples))
+    series = engine.build_trend_series(df, 'All', freq)
+    results['trend_series']['points_all_regions'] = len(series)
+    samples, results['trend_view'] = stage(
+        _timed_calls, lambda k: engine.trend_view(series, k), [(k,) for k in engine.TREND_KINDS]
+    )
+    results['trend_view'].update(_latency_summary(samples))
+
+    current_data, stats = engine.lookup_aggregated_data(cube, *combos[0])
+    trend_data = engine.trend_view(series, 'NSC')
+    _, results['figure_map'] = stage(lambda: figures.build_map_deck(current_data).to_json())
+    _, results['figure_gap'] = stage(lambda: figures.build_gap_figure(current_data, stats['avg_score']).to_json())
+    _, results['figure_trend'] = stage(lambda: figures.build_trend_figure(trend_data).to_json())
+
+    os.remove(path)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the dashboard data pipeline at several dataset sizes.")
+    parser.add_argument('--sizes', nargs='+', default=['10k', '1m'], choices=list(SIZES))
+    parser.add_argument('--output', default='bench_results.json')
+    parser.add_argument('--reference-sample', type=int, default=DEFAULT_REFERENCE_SAMPLE,
+                        help="Filter combinations timed through get_aggregated_data (0 = all)")
+    parser.add_argument('--engines', nargs='*', default=[], choices=[e for e in engine.ENGINES if e != 'pandas'],
+                        help="Also time these aggregation backends and check them against pandas")
+    parser.add_argument('--no-memory', action='store_true', help="Skip tracemalloc peak tracking")
+    args = parser.parse_args(argv)
+
+    stage = Stage(track_memory=not args.no_memory)
+    report = {
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': sys.version.split()[0],
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'sizes': {},
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        for label in args.sizes:
+            print(f"[{label}] running...", file=sys.stderr)
+            report['sizes'][label] = run_size(label, SIZES[label], workdir, stage, args.reference_sample, args.engines)
+
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    report['max_rss_bytes'] = maxrss if sys.platform == 'darwin' else maxrss * 1024
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2, default=float)
+    print(f"Wrote {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+"""Columnar dataset store for the SEM maturity data.
+
+Datasets are read from Parquet or Arrow IPC (Feather v2) files with memory
+mapping and column projection, so only the columns the dashboard needs are
+touched. The embedded CSV in sample_data.py stays available as a fixture and
+is used when no external dataset is configured.
+
+Convert a CSV (or the embedded fixture) to a columnar file with:
+
+    python datastore.py path/to/data.csv data/sem.parquet
+    python datastore.py --fixture data/sem.arrow
+"""
+import argparse
+import io
+import os
+
+import pandas as pd
+
+from sample_data import RAW_CSV_DATA
+
+# Environment variable pointing at the external dataset
+DATASET_PATH_ENV = 'SEM_DATASET_PATH'
+
+PARQUET_SUFFIXES = ('.parquet', '.pq')
+ARROW_SUFFIXES = ('.arrow', '.feather', '.ipc')
+CSV_SUFFIXES = ('.csv',)
+
+
+def resolve_dataset_path(path=None):
+    """Return the configured dataset path, or None to use the fixture."""
+    path = path or os.environ.get(DATASET_PATH_ENV)
+    return path or None
+
+
+def dataset_version(path=None):
+    """Cheap identifier that changes whenever the configured dataset does."""
+    path = resolve_dataset_path(path)
+    if path is None:
+        return 'fixture'
+    if os.path.isdir(path):
+        # A directory's own mtime misses rewrites of files under Year=.../,
+        # so summarize the files inside
+        stats = [os.stat(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names]
+        newest = max((stat.st_mtime_ns for stat in stats), default=0)
+        return f"{os.path.abspath(path)}@{newest}:{sum(stat.st_size for stat in stats)}:{len(stats)}"
+    stat = os.stat(path)
+    return f"{os.path.abspath(path)}@{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _format_for(path):
+    # A directory is a (possibly Hive-partitioned) Parquet dataset
+    if os.path.isdir(path):
+        return 'parquet'
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix in PARQUET_SUFFIXES:
+        return 'parquet'
+    if suffix in ARROW_SUFFIXES:
+        return 'arrow'
+    if suffix in CSV_SUFFIXES:
+        return 'csv'
+    raise ValueError(f"Unsupported dataset format: {path}")
+
+
+def read_fixture(columns=None):
+    return pd.read_csv(io.StringIO(RAW_CSV_DATA), usecols=columns)
+
+
+def read_dataset(path, columns=None):
+    """Read a dataset file, projecting to `columns` when given."""
+    fmt = _format_for(path)
+    if fmt == 'csv':
+        return pd.read_csv(path, usecols=columns)
+
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    if fmt == 'parquet':
+        table = pq.read_table(path, columns=columns, memory_map=True)
+    else:
+        table = feather.read_table(path, columns=columns, memory_map=True)
+    return table.to_pandas()
+
+
+def load_raw_dataset(path=None, columns=None):
+    """Read the configured dataset, falling back to the embedded fixture."""
+    path = resolve_dataset_path(path)
+    if path is None:
+        return read_fixture(columns)
+    return read_dataset(path, columns)
+
+
+def write_dataset(df, path):
+    if os.path.isdir(path):
+        raise ValueError(f"Cannot write a single file over the partitioned dataset directory {path}")
+    fmt = _format_for(path)
+    if fmt == 'csv':
+        raise ValueError("Target must be a columnar format (Parquet or Arrow IPC)")
+
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    # Write beside the target and swap it in, so readers never see a partial file
+    root, suffix = os.path.splitext(path)
+    tmp_path = f"{root}.tmp{suffix}"
+    if fmt == 'parquet':
+        pq.write_table(table, tmp_path, compression='zstd')
+    else:
+        # Uncompressed IPC so readers can memory-map without decoding
+        feather.write_feather(table, tmp_path, compression='uncompressed')
+    os.replace(tmp_path, path)
+
+
+def convert_csv(src, dest):
+    """Convert a CSV file (or the embedded fixture when `src` is None)."""
+    df = read_fixture() if src is None else pd.read_csv(src)
+    write_dataset(df, dest)
+    return len(df)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert SEM CSV data to a columnar dataset.")
+    parser.add_argument('src', nargs='?', help="Source CSV file")
+    parser.add_argument('dest', help="Target .parquet or .arrow file")
+    parser.add_argument('--fixture', action='store_true', help="Convert the embedded sample data")
+    args = parser.parse_args(argv)
+
+    if args.fixture == bool(args.src):
+        parser.error("Pass either a source CSV or --fixture")
+
+    rows = convert_csv(None if args.fixture else args.src, args.dest)
+    print(f"Wrote {rows} rows to {args.dest}")
+
+
+if __name__ == '__main__':
+    main()
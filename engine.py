@@ -0,0 +1,672 @@
+"""Headless analytics engine for the SEM maturity dashboard.
+
+Loading, preprocessing, filter aggregation (reference path and precomputed
+cube with period-over-period deltas) and trend series, with no Streamlit,
+plotting or LLM imports, so batch jobs can use it directly. The dashboard in
+app.py is a thin client that caches and renders these results.
+
+    python engine.py --year 2025 --month Oct --region Europe
+    python engine.py --year 2025 --quarter 3 --format csv --output q3.csv
+    python engine.py --trend --region LATAM --dataset data/sem.parquet
+"""
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+import datastore
+import ingest
+
+# Aggregation backend per deployment: 'pandas' (in-memory frame, precomputed
+# cube), 'duckdb' (SQL pushed down into the dataset file, see sql_engine.py)
+# or 'polars' (lazy multi-threaded plans over the file, see polars_engine.py)
+ENGINE_ENV = 'SEM_ENGINE'
+ENGINES = ('pandas', 'duckdb', 'polars')
+
+# The dataset itself is read through datastore.py: an external Parquet/Arrow
+# file when SEM_DATASET_PATH is set, otherwise the embedded sample CSV.
+DATASET_COLUMNS = [
+    'Date', 'Year', 'Month', 'Region', 'Country', 'NSC', 'Framework',
+    'Framework_Score', 'Monthly_Total_Budget', 'Allocated_Cost',
+]
+
+NSC_TO_NAME = {
+    'HMA': 'Hyundai Motor America',
+    'HAC': 'Hyundai Auto Canada',
+    'HMM': 'Hyundai Motor Mexico',
+    'HMD': 'Hyundai Motor Deutschland',
+    'HMUK': 'Hyundai Motor UK',
+    'HMF': 'Hyundai Motor France',
+    'HMS': 'Hyundai Motor Spain',
+    'HMI': 'Hyundai Motor Italy',
+    'HMCA': 'Hyundai Motor Company Australia',
+    'HMID': 'Hyundai Motor Indonesia',
+    'HMIL': 'Hyundai Motor India Ltd',
+    'HMB': 'Hyundai Motor Brasil'
+}
+
+COORDINATES = {
+  'HMA': {'lat': 37.0902, 'lng': -95.7129},
+  'HAC': {'lat': 56.1304, 'lng': -106.3468},
+  'HMM': {'lat': 23.6345, 'lng': -102.5528},
+  'HMD': {'lat': 51.1657, 'lng': 10.4515},
+  'HMUK': {'lat': 55.3781, 'lng': -3.4360},
+  'HMF': {'lat': 46.2276, 'lng': 2.2137},
+  'HMS': {'lat': 40.4637, 'lng': -3.7492},
+  'HMI': {'lat': 41.8719, 'lng': 12.5674},
+  'HMCA': {'lat': -25.2744, 'lng': 133.7751},
+  'HMID': {'lat': -0.7893, 'lng': 113.9213},
+  'HMIL': {'lat': 20.5937, 'lng': 78.9629},
+  'HMB': {'lat': -14.2350, 'lng': -51.9253},
+}
+
+FRAMEWORKS = ['Performance & Coverage', 'Quality Excellence', 'Data Infrastructure', 'AI Adoption']
+GROUP_KEYS = ['NSC', 'FullName', 'Region', 'Country']
+MONTH_NAMES = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+CATEGORICAL_COLUMNS = ['Region', 'Country', 'NSC', 'Framework', 'FullName']
+REGION_RENAMES = {'Central & South America': 'LATAM'}
+NSC_LAT = {nsc: coords['lat'] for nsc, coords in COORDINATES.items()}
+NSC_LNG = {nsc: coords['lng'] for nsc, coords in COORDINATES.items()}
+
+def preprocess_data(df):
+    # Compact dtypes: low-cardinality strings as categoricals, scores as float32.
+    # Budgets and costs stay float64 so monthly sums keep cent precision. Converting
+    # first means the mappings below only touch each category once.
+    for col in ['Region', 'Country', 'NSC', 'Framework']:
+        df[col] = df[col].astype('category')
+    df['Framework_Score'] = df['Framework_Score'].astype('float32')
+    
+    # Add FullName column (unknown NSCs keep their code instead of dropping out of the pivots)
+    df['FullName'] = df['NSC'].map(lambda nsc: NSC_TO_NAME.get(nsc, nsc)).astype('category')
+    
+    # Month Name and Quarter, derived by lookup/arithmetic rather than per row
+    df['Year'] = df['Year'].astype('int16')
+    df['Month'] = df['Month'].astype('int8')
+    df['Month_Name'] = pd.Categorical.from_codes(df['Month'].to_numpy() - 1, categories=MONTH_NAMES)
+    df['Quarter'] = ((df['Month'] - 1) // 3 + 1).astype('int8')
+
+    # Only the day of month is kept from Date; Year/Month already hold the rest
+    if 'Date' in df:
+        dates = df['Date'] if pd.api.types.is_datetime64_any_dtype(df['Date']) else pd.to_datetime(df['Date'], format='mixed')
+        df['Day'] = dates.dt.day.astype('int8')
+        del df['Date']
+    
+    # Normalize Region
+    df['Region'] = df['Region'].map(lambda r: REGION_RENAMES.get(r, r)).astype('category')
+    
+    return df
+
+def selected_engine(name=None):
+    name = name or os.environ.get(ENGINE_ENV) or 'pandas'
+    if name not in ENGINES:
+        raise ValueError(f"Unknown aggregation engine: {name!r} (expected one of {ENGINES})")
+    return name
+
+def open_backend(name, path=None):
+    # Query backend for a non-pandas engine (None for pandas); imported lazily
+    # since duckdb and polars are optional
+    name = selected_engine(name)
+    if name == 'duckdb':
+        import sql_engine
+
+        return sql_engine.DuckDBEngine(path)
+    if name == 'polars':
+        import polars_engine
+
+        return polars_engine.PolarsEngine(path)
+    return None
+
+def raw_region_names(region_filter):
+    # Query backends scan the dataset's source region names: every one that renames to the filter
+    return [r for r, renamed in REGION_RENAMES.items() if renamed == region_filter] + [region_filter]
+
+def backend_parser(description):
+    # Filter arguments shared by the query backend CLIs (sql_engine.py, polars_engine.py)
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--dataset', help=f"Parquet/Arrow/CSV file or partitioned directory (default: ${datastore.DATASET_PATH_ENV})")
+    parser.add_argument('--year', type=int, help="Defaults to the latest year in the dataset")
+    parser.add_argument('--quarter', default='All', choices=['All', '1', '2', '3', '4'])
+    parser.add_argument('--month', default='All', choices=['All'] + MONTH_NAMES)
+    parser.add_argument('--region', default='All')
+    parser.add_argument('--explain', action='store_true', help="Print the query plan with pushed-down filters")
+    return parser
+
+def run_backend_cli(parser, backend, args):
+    # Print one filter's markets and stats (or the plan) from a backend_parser CLI
+    year = args.year if args.year is not None else backend.latest_year()
+    if args.explain:
+        print(backend.explain(year, args.quarter, args.month, args.region))
+        return
+    final_agg, stats = backend.get_aggregated_data(year, args.quarter, args.month, args.region)
+    if final_agg is None:
+        parser.exit(1, "No data available for the selected filters.\n")
+    print(final_agg.to_string(index=False))
+    print(f"avg_score={stats['avg_score']:.2f} total_budget={stats['total_budget']:,.2f} comparison={stats['comparison']}")
+
+def load_and_process_data(path=None):
+    return preprocess_data(datastore.load_raw_dataset(path, columns=DATASET_COLUMNS))
+
+def memory_footprint(df):
+    usage = df.memory_usage(deep=True, index=True)
+    return {'rows': len(df), 'total_bytes': int(usage.sum()), 'columns': usage.astype(int).to_dict()}
+
+# Columns monthly_base reads; per-filter selections take only these
+BASE_COLUMNS = GROUP_KEYS + ['Year', 'Month', 'Framework', 'Framework_Score', 'Monthly_Total_Budget']
+
+def monthly_base(filtered):
+    # Pivot Framework Scores
+    pivot_df = filtered.pivot_table(
+        index=['NSC', 'FullName', 'Region', 'Country', 'Year', 'Month'], 
+        columns='Framework', 
+        values='Framework_Score',
+        observed=True
+    ).reset_index()
+    
+    # Aggregate Budget
+    budget_df = filtered.groupby(['NSC', 'Year', 'Month'], observed=True)['Monthly_Total_Budget'].max().reset_index()
+    return pd.merge(pivot_df, budget_df, on=['NSC', 'Year', 'Month'])
+
+def finalize_aggregate(final_agg):
+    # Calculate Overall Score
+    final_agg['Overall_Score'] = final_agg[FRAMEWORKS].mean(axis=1)
+    
+    # Add Coordinates
+    final_agg['lat'] = final_agg['NSC'].map(NSC_LAT).astype('float64')
+    final_agg['lng'] = final_agg['NSC'].map(NSC_LNG).astype('float64')
+    
+    # Global Stats
+    global_stats = {
+        'avg_score': final_agg['Overall_Score'].mean(),
+        'total_budget': final_agg['Monthly_Total_Budget'].sum(),
+        'top_performer': final_agg.loc[final_agg['Overall_Score'].idxmax()],
+        'worst_performer': final_agg.loc[final_agg['Overall_Score'].idxmin()],
+    }
+    
+    return final_agg, global_stats
+
+# Period-over-period comparisons offered for each view, as lags in that view's periods
+DELTA_LAGS = {
+    'Month': {'MoM': 1, 'QoQ': 3, 'YoY': 12},
+    'Quarter': {'QoQ': 1, 'YoY': 4},
+    'Year': {'YoY': 1},
+}
+PRIMARY_DELTA = {'Month': 'MoM', 'Quarter': 'QoQ', 'Year': 'YoY'}
+
+def filter_granularity(quarter, month):
+    if month != 'All':
+        return 'Month'
+    return 'Quarter' if quarter != 'All' else 'Year'
+
+def pct_change(current, previous):
+    if pd.isna(current) or pd.isna(previous) or previous == 0:
+        return None
+    return float((current - previous) / previous * 100)
+
+def point_change(current, previous):
+    if pd.isna(current) or pd.isna(previous):
+        return None
+    return float(current - previous)
+
+def attach_deltas(global_stats, deltas, granularity):
+    # deltas: {'avg_score'|'total_budget' (%), 'top_performer'|'worst_performer' (pts): {label: change}}
+    global_stats['deltas'] = deltas
+    global_stats['comparison'] = PRIMARY_DELTA[granularity]
+    global_stats['mom_change'] = deltas['avg_score'].get('MoM')
+    return global_stats
+
+def comparison_periods(year, quarter, month):
+    # (year, quarter, month) filter values of each comparison period
+    granularity = filter_granularity(quarter, month)
+    if granularity == 'Month':
+        index = int(year) * 12 + MONTH_NAMES.index(month)
+        return {
+            label: ((index - lag) // 12, 'All', MONTH_NAMES[(index - lag) % 12])
+            for label, lag in DELTA_LAGS['Month'].items()
+        }
+    if granularity == 'Quarter':
+        index = int(year) * 4 + int(quarter) - 1
+        return {
+            label: ((index - lag) // 4, str((index - lag) % 4 + 1), 'All')
+            for label, lag in DELTA_LAGS['Quarter'].items()
+        }
+    return {'YoY': (int(year) - 1, 'All', 'All')}
+
+def reference_deltas(aggregate, year, quarter, month, region_filter, global_stats):
+    # Re-aggregates each comparison period via `aggregate(year, quarter, month, region)`
+    # (without deltas); the cube uses lag tables instead
+    deltas = {'avg_score': {}, 'total_budget': {}, 'top_performer': {}, 'worst_performer': {}}
+    for label, (prev_year, prev_quarter, prev_month) in comparison_periods(year, quarter, month).items():
+        prev_agg, prev_stats = aggregate(prev_year, prev_quarter, prev_month, region_filter)
+        if prev_agg is None:
+            prev_stats, prev_scores = {}, pd.Series(dtype='float64')
+        else:
+            prev_scores = prev_agg.set_index(prev_agg['NSC'].astype(str))['Overall_Score']
+        deltas['avg_score'][label] = pct_change(global_stats['avg_score'], prev_stats.get('avg_score'))
+        deltas['total_budget'][label] = pct_change(global_stats['total_budget'], prev_stats.get('total_budget'))
+        for card in ('top_performer', 'worst_performer'):
+            performer = global_stats[card]
+            deltas[card][label] = point_change(performer['Overall_Score'], prev_scores.get(str(performer['NSC'])))
+    return deltas
+
+def filter_mask(df, year, quarter, month, region_filter):
+    # Rows selected by the sidebar filters, as a boolean array over `df`
+    mask = (df['Year'] == year).to_numpy()
+    if quarter != 'All':
+        mask = mask & (df['Quarter'] == int(quarter)).to_numpy()
+    if month != 'All':
+        month_num = MONTH_NAMES.index(month) + 1
+        mask = mask & (df['Month'] == month_num).to_numpy()
+    if region_filter != 'All':
+        mask = mask & (df['Region'] == region_filter).to_numpy()
+    return mask
+
+def get_aggregated_data(df, year, quarter, month, region_filter, with_deltas=True):
+    filtered = df.loc[filter_mask(df, year, quarter, month, region_filter), BASE_COLUMNS]
+
+    if filtered.empty:
+        return None, None
+
+    pivot_df = monthly_base(filtered)
+    
+    # Final Aggregation
+    final_agg = pivot_df.groupby(GROUP_KEYS, observed=True).agg({
+        'Performance & Coverage': 'mean',
+        'Quality Excellence': 'mean',
+        'Data Infrastructure': 'mean',
+        'AI Adoption': 'mean',
+        'Monthly_Total_Budget': 'sum'
+    }).reset_index()
+    
+    final_agg, global_stats = finalize_aggregate(final_agg)
+    if with_deltas:
+        aggregate = lambda *filters: get_aggregated_data(df, *filters, with_deltas=False)
+        deltas = reference_deltas(aggregate, year, quarter, month, region_filter, global_stats)
+        attach_deltas(global_stats, deltas, filter_granularity(quarter, month))
+    return final_agg, global_stats
+
+def rollup_aggregate(rollup):
+    # (final_agg, global_stats) from another backend's per-market rows: NSC,
+    # source Region, Country, framework means and the summed monthly budget
+    if rollup.empty:
+        return None, None
+    rollup['NSC'] = rollup['NSC'].astype(str)
+    rollup['Region'] = rollup['Region'].map(lambda r: REGION_RENAMES.get(r, r))
+    rollup['FullName'] = rollup['NSC'].map(lambda nsc: NSC_TO_NAME.get(nsc, nsc))
+    dtypes = {col: 'category' for col in GROUP_KEYS}
+    dtypes.update({fw: 'float32' for fw in FRAMEWORKS})
+    final_agg = (
+        rollup[GROUP_KEYS + FRAMEWORKS + ['Monthly_Total_Budget']]
+        .astype(dtypes)
+        .sort_values(GROUP_KEYS, ignore_index=True)
+    )
+    return finalize_aggregate(final_agg)
+
+def aggregates_match(expected, actual, rtol=1e-4, atol=1e-3):
+    """Whether two (final_agg, global_stats) results agree, floats within tolerance.
+
+    Used to check alternative backends against get_aggregated_data; returns
+    (True, None) or (False, reason).
+    """
+    (expected_agg, expected_stats), (actual_agg, actual_stats) = expected, actual
+    if expected_agg is None or actual_agg is None:
+        return (expected_agg is None and actual_agg is None), 'one result is empty'
+    labels = {col: str for col in GROUP_KEYS}
+    try:
+        pd.testing.assert_frame_equal(
+            expected_agg.astype(labels), actual_agg.astype(labels),
+            check_dtype=False, rtol=rtol, atol=atol,
+        )
+    except AssertionError as e:
+        return False, str(e)
+    for card in ('top_performer', 'worst_performer'):
+        if str(expected_stats[card]['NSC']) != str(actual_stats[card]['NSC']):
+            return False, f"{card} differs"
+    for card, changes in expected_stats.get('deltas', {}).items():
+        for label, change in changes.items():
+            other = actual_stats['deltas'][card][label]
+            if (change is None) != (other is None) or (change is not None and abs(change - other) > atol * 10):
+                return False, f"{card} {label} delta {change} != {other}"
+    return True, None
+
+def trends_match(expected, actual, rtol=1e-4, atol=1e-3):
+    """Whether two get_trend_data results agree; returns (True, None) or (False, reason)."""
+    columns = ['Date', 'Year', 'Month', 'Framework_Score']
+    try:
+        pd.testing.assert_frame_equal(
+            expected[columns].reset_index(drop=True), actual[columns].reset_index(drop=True),
+            check_dtype=False, rtol=rtol, atol=atol,
+        )
+    except AssertionError as e:
+        return False, str(e)
+    return True, None
+
+def build_lag_tables(rolled, granularity):
+    """Current and lagged Overall/budget values for one view granularity.
+
+    Each table is a (period x entity) frame over a gap-free period index, so a
+    lag of k periods is a single vectorized shift: NSC scores per NSC, and
+    average score and total budget per region (plus 'All').
+    """
+    overall = rolled[FRAMEWORKS].mean(axis=1)
+    if granularity == 'Month':
+        period = rolled['Year'].astype(int) * 12 + rolled['Month'].astype(int) - 1
+    elif granularity == 'Quarter':
+        period = rolled['Year'].astype(int) * 4 + rolled['Quarter'].astype(int) - 1
+    else:
+        period = rolled['Year'].astype(int)
+    panel = pd.DataFrame({
+        'Period': period,
+        'NSC': rolled['NSC'].astype(str),
+        'Region': rolled['Region'].astype(str),
+        'Overall_Score': overall,
+        'Monthly_Total_Budget': rolled['Monthly_Total_Budget'],
+    })
+
+    wide = {
+        'nsc_score': panel.pivot_table(index='Period', columns='NSC', values='Overall_Score'),
+        'region_score': panel.pivot_table(index='Period', columns='Region', values='Overall_Score', aggfunc='mean'),
+        'region_budget': panel.pivot_table(index='Period', columns='Region', values='Monthly_Total_Budget', aggfunc='sum'),
+    }
+    wide['region_score']['All'] = panel.groupby('Period')['Overall_Score'].mean()
+    wide['region_budget']['All'] = panel.groupby('Period')['Monthly_Total_Budget'].sum()
+
+    periods = pd.RangeIndex(panel['Period'].min(), panel['Period'].max() + 1)
+    tables = {}
+    for name, frame in wide.items():
+        frame = frame.reindex(periods)
+        tables[name] = {label: frame.shift(lag) for label, lag in DELTA_LAGS[granularity].items()}
+        tables[name]['current'] = frame
+    return tables
+
+def _lookup_deltas(tables, granularity, period, region, global_stats):
+    def value(name, label, entity):
+        frame = tables[name][label]
+        if period not in frame.index or entity not in frame.columns:
+            return None
+        return frame.at[period, entity]
+
+    deltas = {'avg_score': {}, 'total_budget': {}, 'top_performer': {}, 'worst_performer': {}}
+    for label in DELTA_LAGS[granularity]:
+        deltas['avg_score'][label] = pct_change(
+            value('region_score', 'current', region), value('region_score', label, region)
+        )
+        deltas['total_budget'][label] = pct_change(
+            value('region_budget', 'current', region), value('region_budget', label, region)
+        )
+        for card in ('top_performer', 'worst_performer'):
+            nsc = str(global_stats[card]['NSC'])
+            deltas[card][label] = point_change(
+                value('nsc_score', 'current', nsc), value('nsc_score', label, nsc)
+            )
+    return deltas
+
+def build_aggregation_cube(df, years=None):
+    """Pre-roll get_aggregated_data for every (Year, Quarter, Month, Region) filter.
+
+    Returns a dict keyed by the sidebar filter values, where Quarter, Month and
+    Region may each be 'All'. Combinations without data are absent. With
+    `years`, only entries for those years are built (the prior year is still
+    read so YoY/MoM deltas have their baseline).
+    """
+    if years is not None:
+        years = {int(y) for y in years}
+        df = df[df['Year'].isin(years | {y - 1 for y in years})]
+    base = monthly_base(df)
+    base['Quarter'] = (base['Month'] - 1) // 3 + 1
+    agg_spec = {fw: 'mean' for fw in FRAMEWORKS}
+    agg_spec['Monthly_Total_Budget'] = 'sum'
+
+    cube = {}
+
+    def add_period(keys, rolled, tables, granularity, period_index):
+        part = rolled[GROUP_KEYS + list(agg_spec)].reset_index(drop=True)
+        parts = [('All', part)] + [
+            (region, region_part.reset_index(drop=True))
+            for region, region_part in part.groupby('Region', sort=True, observed=True)
+        ]
+        for region, region_part in parts:
+            final_agg, global_stats = finalize_aggregate(region_part)
+            deltas = _lookup_deltas(tables, granularity, period_index, str(region), global_stats)
+            result = (final_agg, attach_deltas(global_stats, deltas, granularity))
+            for year, quarter, month in keys:
+                cube[(year, quarter, month, region)] = result
+
+    levels = [('Year', ['Year']), ('Quarter', ['Year', 'Quarter']), ('Month', ['Year', 'Quarter', 'Month'])]
+    for granularity, period_cols in levels:
+        rolled = base.groupby(period_cols + GROUP_KEYS, observed=True).agg(agg_spec).reset_index()
+        tables = build_lag_tables(rolled, granularity)
+        for period, part in rolled.groupby(period_cols, sort=True):
+            year = int(period[0])
+            if years is not None and year not in years:
+                continue
+            if granularity == 'Year':
+                keys = [(year, 'All', 'All')]
+                period_index = year
+            elif granularity == 'Quarter':
+                keys = [(year, str(period[1]), 'All')]
+                period_index = year * 4 + int(period[1]) - 1
+            else:
+                month_name = MONTH_NAMES[int(period[2]) - 1]
+                keys = [(year, 'All', month_name), (year, str(period[1]), month_name)]
+                period_index = year * 12 + int(period[2]) - 1
+            add_period(keys, part, tables, granularity, period_index)
+
+    return cube
+
+def affected_years(df, years):
+    # Changed years plus each following year in `df`: its Jan MoM, Q1 QoQ and
+    # YoY deltas compare against the changed one
+    years = {int(y) for y in years}
+    return years | {y + 1 for y in years if (df['Year'] == y + 1).any()}
+
+def update_aggregation_cube(cube, df, years):
+    """Return a copy of `cube` with every entry for `years` rebuilt from `df`.
+
+    `years` must already include the years whose deltas depend on the changed
+    ones (affected_years, as merge_increment returns them).
+    """
+    updated = {key: value for key, value in cube.items() if key[0] not in years}
+    updated.update(build_aggregation_cube(df, years))
+    return updated
+
+def lookup_aggregated_data(cube, year, quarter, month, region_filter):
+    # Same contract as get_aggregated_data, served from the pre-rolled cube
+    return cube.get((int(year), quarter, month, region_filter), (None, None))
+
+def get_trend_data(df, region_filter):
+    trend_columns = ['Year', 'Month', 'NSC', 'Framework_Score']
+    filtered = df[trend_columns] if region_filter == 'All' else df.loc[df['Region'] == region_filter, trend_columns]
+
+    daily = filtered.groupby(['Year', 'Month', 'NSC'], observed=True)['Framework_Score'].mean().reset_index()
+    trend = daily.groupby(['Year', 'Month'])['Framework_Score'].mean().reset_index()
+    trend['Date'] = pd.to_datetime(trend[['Year', 'Month']].assign(DAY=1))
+    
+    return trend.sort_values('Date')
+
+
+# Trend series: total, per framework and per NSC, downsampled to a point budget
+TREND_KINDS = ('Overall', 'Framework', 'NSC')
+TREND_FREQS = ('M', 'D')
+TREND_POINT_BUDGET = 1500
+MIN_POINTS_PER_SERIES = 50
+
+def build_trend_series(df, region_filter, freq='M'):
+    """Every trend series for a region from one grouped pass.
+
+    Returns a long frame of Date, Kind ('Overall', 'Framework' or 'NSC'),
+    Series (framework name, NSC code, or 'Overall') and Framework_Score.
+    NSC series pool all framework scores of the period; the Overall and
+    framework series average across NSCs, so Overall matches get_trend_data.
+    With freq='D' periods are days (when the dataset kept Day), else months.
+    """
+    filtered = df if region_filter == 'All' else df[df['Region'] == region_filter]
+    period_cols = ['Year', 'Month'] + (['Day'] if freq == 'D' and 'Day' in df else [])
+    grouped = filtered.groupby(period_cols + ['NSC', 'Framework'], observed=True)['Framework_Score'].agg(['sum', 'count'])
+    grouped = grouped.reset_index()
+    parts = {col.lower(): grouped[col] for col in period_cols}
+    parts.setdefault('day', 1)
+    grouped['Date'] = pd.to_datetime(pd.DataFrame(parts))
+
+    nsc = grouped.groupby(['Date', 'NSC'], observed=True)[['sum', 'count']].sum()
+    nsc_score = (nsc['sum'] / nsc['count']).rename('Framework_Score')
+    overall = nsc_score.groupby(level='Date').mean()
+    framework_score = (grouped['sum'] / grouped['count']).groupby(
+        [grouped['Date'], grouped['Framework']], observed=True
+    ).mean().rename('Framework_Score')
+
+    frames = [
+        overall.reset_index().assign(Kind='Overall', Series='Overall'),
+        framework_score.reset_index().rename(columns={'Framework': 'Series'}).assign(Kind='Framework'),
+        nsc_score.reset_index().rename(columns={'NSC': 'Series'}).assign(Kind='NSC'),
+    ]
+    series = pd.concat(
+        [frame.astype({'Series': str}) for frame in frames], ignore_index=True
+    )[['Date', 'Kind', 'Series', 'Framework_Score']]
+    series['Kind'] = series['Kind'].astype('category')
+    series['Series'] = series['Series'].astype('category')
+    return series.sort_values(['Kind', 'Series', 'Date'], ignore_index=True)
+
+def downsample_lttb(x, y, threshold):
+    """Indices of at most `threshold` points chosen by Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last point and, per bucket, the point forming the
+    largest triangle with the previously kept point and the next bucket's
+    mean, so peaks and troughs survive the reduction.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    kept = np.empty(threshold, dtype=np.int64)
+    kept[0], kept[-1] = 0, n - 1
+    previous = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_x, next_y = x[end:edges[i + 2]].mean(), y[end:edges[i + 2]].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+        area = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        kept[i + 1] = previous
+    return kept
+
+def trend_view(series, kind='Overall', max_points=TREND_POINT_BUDGET):
+    """One kind of series from build_trend_series, each downsampled so the total stays near `max_points`."""
+    selected = series[series['Kind'] == kind]
+    groups = list(selected.groupby('Series', observed=True, sort=True))
+    if not groups:
+        return selected.reset_index(drop=True)
+    per_series = max(MIN_POINTS_PER_SERIES, max_points // len(groups))
+    parts = []
+    for _, part in groups:
+        x = part['Date'].to_numpy('datetime64[ns]').astype(np.int64)
+        parts.append(part.iloc[downsample_lttb(x, part['Framework_Score'].to_numpy(), per_series)])
+    return pd.concat(parts, ignore_index=True)
+
+def merge_increment(df, rows):
+    """Upsert raw `rows` into the processed `df`; returns (df, affected years, touched regions).
+
+    Affected years are the touched ones plus the years whose deltas compare
+    against them, i.e. every year whose aggregates changed.
+    """
+    increment = preprocess_data(rows[[c for c in DATASET_COLUMNS if c in rows.columns]].copy())
+    df = ingest.upsert_periods(df, increment)
+    # Categories differ between the stored frame and the increment after concat
+    for col in CATEGORICAL_COLUMNS:
+        df[col] = df[col].astype('category')
+    years = affected_years(df, increment['Year'].unique())
+    regions = set(increment['Region'].astype(str))
+    return df, years, regions
+
+# Scores are float32 internally; round so output doesn't carry representation noise
+OUTPUT_DECIMALS = 4
+
+def stats_record(stats):
+    record = {
+        'avg_score': round(float(stats['avg_score']), OUTPUT_DECIMALS),
+        'total_budget': round(float(stats['total_budget']), 2),
+    }
+    for card in ('top_performer', 'worst_performer'):
+        score = round(float(stats[card]['Overall_Score']), OUTPUT_DECIMALS)
+        record[card] = {'NSC': str(stats[card]['NSC']), 'Overall_Score': score}
+    if 'deltas' in stats:
+        record['comparison'] = stats['comparison']
+        record['deltas'] = stats['deltas']
+    return record
+
+def markets_frame(final_agg):
+    scores = FRAMEWORKS + ['Overall_Score']
+    table = final_agg[GROUP_KEYS + scores + ['Monthly_Total_Budget']].astype({c: 'float64' for c in scores})
+    table[scores] = table[scores].round(OUTPUT_DECIMALS)
+    return table.sort_values('Overall_Score', ascending=False)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Emit SEM maturity aggregates for the given filters.")
+    parser.add_argument('--dataset', help=f"Parquet/Arrow/CSV dataset (default: ${datastore.DATASET_PATH_ENV} or the fixture)")
+    parser.add_argument('--year', type=int, help="Defaults to the latest year in the dataset")
+    parser.add_argument('--quarter', default='All', choices=['All', '1', '2', '3', '4'])
+    parser.add_argument('--month', default='All', choices=['All'] + MONTH_NAMES)
+    parser.add_argument('--region', default='All')
+    parser.add_argument('--trend', action='store_true', help="Emit trend series instead of aggregates")
+    parser.add_argument('--kind', choices=TREND_KINDS, default='Overall', help="Trend series to emit")
+    parser.add_argument('--freq', choices=TREND_FREQS, default='M', help="Trend periods: months or days")
+    parser.add_argument('--max-points', type=int, default=TREND_POINT_BUDGET, help="Trend point budget (LTTB downsampling)")
+    parser.add_argument('--no-deltas', action='store_true', help="Skip period-over-period comparisons")
+    parser.add_argument('--engine', choices=ENGINES, help=f"Aggregation backend (default: ${ENGINE_ENV} or pandas)")
+    parser.add_argument('--format', choices=['json', 'csv'], default='json')
+    parser.add_argument('--output', help="Write here instead of stdout")
+    args = parser.parse_args(argv)
+
+    path = datastore.resolve_dataset_path(args.dataset)
+
+    if args.trend:
+        df = load_and_process_data(path)
+        table = trend_view(build_trend_series(df, args.region, args.freq), args.kind, args.max_points)
+        table = table.astype({'Kind': str, 'Series': str, 'Framework_Score': 'float64'})
+        table['Framework_Score'] = table['Framework_Score'].round(OUTPUT_DECIMALS)
+        payload = {
+            'region': args.region, 'kind': args.kind, 'freq': args.freq,
+            'trend': table.assign(Date=table['Date'].dt.strftime('%Y-%m-%d')).to_dict('records'),
+        }
+    else:
+        backend = open_backend(args.engine, path)
+        if backend is not None:
+            # Queries the file directly; the full frame is never loaded
+            aggregate, latest_year = backend.get_aggregated_data, backend.latest_year
+        else:
+            df = load_and_process_data(path)
+            aggregate = lambda *filters, **kwargs: get_aggregated_data(df, *filters, **kwargs)
+            latest_year = lambda: int(df['Year'].max())
+        year = args.year if args.year is not None else latest_year()
+        final_agg, stats = aggregate(year, args.quarter, args.month, args.region, with_deltas=not args.no_deltas)
+        if final_agg is None:
+            parser.exit(1, "No data available for the selected filters.\n")
+        table = markets_frame(final_agg)
+        payload = {
+            'filters': {'year': year, 'quarter': args.quarter, 'month': args.month, 'region': args.region},
+            'stats': stats_record(stats),
+            'markets': json.loads(table.to_json(orient='records')),
+        }
+
+    out = open(args.output, 'w', newline='') if args.output else sys.stdout
+    try:
+        if args.format == 'csv':
+            table.to_csv(out, index=False)
+        else:
+            json.dump(payload, out, indent=2, default=str)
+            out.write('\n')
+    finally:
+        if args.output:
+            out.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,173 @@
+"""Chunked CSV/Parquet export of filtered markets, raw rows and trend series.
+
+Writers take an iterator of DataFrame chunks and stream them to a binary
+sink: CSV chunk by chunk with the header once, Parquet one row group per
+chunk, with scores as float64 rounded to engine.OUTPUT_DECIMALS. Raw rows
+are taken from the in-memory frame by position under the same filter as
+get_aggregated_data (engine.filter_mask), so an export holds one chunk at a
+time rather than a copy of every filtered row plus its serialized text:
+
+    python export.py raw --year 2025 --quarter 3 --format parquet --output q3_rows.parquet
+    python export.py markets --year 2025 --month Oct --format csv
+"""
+import argparse
+import io
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+import datastore
+import engine
+import ranges
+
+EXPORT_FORMATS = ('csv', 'parquet')
+MIME_TYPES = {'csv': 'text/csv', 'parquet': 'application/vnd.apache.parquet'}
+CHUNK_ROWS = 100_000
+EXPORTS = ('markets', 'raw', 'trend')
+SCORE_COLUMNS = engine.FRAMEWORKS + ['Overall_Score', 'Framework_Score']
+
+
+def frame_chunks(frame, chunk_rows=CHUNK_ROWS):
+    # An empty frame still yields one (empty) chunk so files get a header/schema
+    for start in range(0, max(len(frame), 1), chunk_rows):
+        yield frame.iloc[start:start + chunk_rows]
+
+
+def mask_chunks(df, mask, chunk_rows=CHUNK_ROWS):
+    """Rows of `df` where the boolean array `mask` is set, `chunk_rows` at a time."""
+    positions = np.flatnonzero(mask)
+    for start in range(0, max(len(positions), 1), chunk_rows):
+        yield df.take(positions[start:start + chunk_rows])
+
+
+def raw_row_chunks(df, year, quarter, month, region_filter, chunk_rows=CHUNK_ROWS):
+    """Rows of `df` matching the sidebar filters, `chunk_rows` at a time."""
+    return mask_chunks(df, engine.filter_mask(df, year, quarter, month, region_filter), chunk_rows)
+
+
+def range_row_chunks(df, start, end, region_filter, chunk_rows=CHUNK_ROWS):
+    """Rows of `df` in the month range start..end (ranges.py month indexes)."""
+    return mask_chunks(df, ranges.range_mask(df, start, end, region_filter), chunk_rows)
+
+
+def write_csv(chunks, sink):
+    text = io.TextIOWrapper(sink, encoding='utf-8', newline='', write_through=True)
+    header = True
+    for chunk in chunks:
+        chunk.to_csv(text, header=header, index=False)
+        header = False
+    # Hand the binary sink back to the caller open
+    text.detach()
+
+
+def write_parquet(chunks, sink):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    for chunk in chunks:
+        table = pa.Table.from_pandas(chunk, preserve_index=False)
+        if writer is None:
+            writer = pq.ParquetWriter(sink, table.schema, compression='zstd')
+        writer.write_table(table)
+    if writer is not None:
+        writer.close()
+
+
+WRITERS = {'csv': write_csv, 'parquet': write_parquet}
+
+
+def output_chunk(chunk):
+    # Scores are float32 internally (or float64 means of them); write them as
+    # float64 rounded like the engine CLI output, without representation noise
+    scores = [col for col in SCORE_COLUMNS if col in chunk.columns]
+    if not scores:
+        return chunk
+    return chunk.astype({col: 'float64' for col in scores}).round({col: engine.OUTPUT_DECIMALS for col in scores})
+
+
+def write_export(chunks, fmt, sink):
+    if fmt not in WRITERS:
+        raise ValueError(f"Unknown export format: {fmt!r} (expected one of {EXPORT_FORMATS})")
+    WRITERS[fmt]((output_chunk(chunk) for chunk in chunks), sink)
+
+
+def export_file(chunks, fmt):
+    """Stream `chunks` to a temporary file and return its bytes.
+
+    The file is read back and removed before returning, so no handle outlives
+    the call.
+    """
+    handle, path = tempfile.mkstemp(prefix='sem-export-', suffix=f'.{fmt}')
+    try:
+        with os.fdopen(handle, 'wb') as sink:
+            write_export(chunks, fmt, sink)
+        with open(path, 'rb') as f:
+            return f.read()
+    finally:
+        os.unlink(path)
+
+
+def trend_chunks(series, kind, chunk_rows=CHUNK_ROWS):
+    """Every point of one kind of build_trend_series output (not downsampled)."""
+    return frame_chunks(series[series['Kind'] == kind], chunk_rows)
+
+
+def filter_parts(year, quarter, month, region_filter):
+    return [year, f"Q{quarter}" if quarter != 'All' else 'All', month, region_filter]
+
+
+def range_parts(start, end, region_filter):
+    return [ranges.month_label(start), 'to', ranges.month_label(end), region_filter]
+
+
+def export_name(fmt, *parts):
+    # e.g. sem_markets_2025_Q3_Europe.csv; 'All' filters are left out
+    stem = '_'.join(['sem'] + [str(p) for p in parts if p is not None and p != 'All'])
+    return f"{stem.replace(' ', '-').replace('&', 'and')}.{fmt}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export filtered markets, raw rows or the trend as CSV/Parquet.")
+    parser.add_argument('kind', choices=EXPORTS)
+    parser.add_argument('--dataset', help=f"Parquet/Arrow/CSV dataset (default: ${datastore.DATASET_PATH_ENV} or the fixture)")
+    parser.add_argument('--year', type=int, help="Defaults to the latest year in the dataset")
+    parser.add_argument('--quarter', default='All', choices=['All', '1', '2', '3', '4'])
+    parser.add_argument('--month', default='All', choices=['All'] + engine.MONTH_NAMES)
+    parser.add_argument('--region', default='All')
+    parser.add_argument('--trend-kind', choices=engine.TREND_KINDS, default='Overall', help="Trend series to export")
+    parser.add_argument('--freq', choices=engine.TREND_FREQS, default='M', help="Trend periods: months or days")
+    parser.add_argument('--format', choices=EXPORT_FORMATS, default='csv')
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS)
+    parser.add_argument('--output', help="Defaults to a name built from the filters (CSV may go to stdout with -)")
+    args = parser.parse_args(argv)
+
+    df = engine.load_and_process_data(args.dataset)
+    year = args.year if args.year is not None else int(df['Year'].max())
+    if args.kind == 'raw':
+        chunks = raw_row_chunks(df, year, args.quarter, args.month, args.region, args.chunk_rows)
+    elif args.kind == 'markets':
+        final_agg, _ = engine.get_aggregated_data(df, year, args.quarter, args.month, args.region, with_deltas=False)
+        if final_agg is None:
+            parser.exit(1, "No data available for the selected filters.\n")
+        chunks = frame_chunks(final_agg, args.chunk_rows)
+    else:
+        chunks = trend_chunks(engine.build_trend_series(df, args.region, args.freq), args.trend_kind, args.chunk_rows)
+
+    if args.kind == 'trend':
+        parts = [args.region, args.trend_kind, args.freq]
+    else:
+        parts = filter_parts(year, args.quarter, args.month, args.region)
+    output = args.output or export_name(args.format, args.kind, *parts)
+    if output == '-':
+        write_export(chunks, args.format, sys.stdout.buffer)
+        return
+    with open(output, 'wb') as sink:
+        write_export(chunks, args.format, sink)
+    print(f"Wrote {output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
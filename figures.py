@@ -0,0 +1,179 @@
+"""Map, chart and KPI card builders for the dashboard, shared with bench.py and report.py.
+
+Each takes engine output (aggregated markets or a trend series) and returns
+a pydeck Deck, Plotly figure or plain values without touching Streamlit.
+"""
+import json
+
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+import pydeck as pdk
+from pydeck.bindings.json_tools import default_serialize
+
+# Score bands for map markers, highest first: (lower bound, RGBA); below all bands is red
+SCORE_BANDS = [
+    (80, (0, 44, 95, 200)),
+    (60, (59, 130, 246, 200)),
+    (50, (234, 179, 8, 200)),
+]
+BELOW_BANDS_COLOR = (239, 68, 68, 200)
+SCORE_PALETTE = np.array([color for _, color in SCORE_BANDS] + [BELOW_BANDS_COLOR], dtype=np.uint8)
+
+MIN_RADIUS = 100000
+RADIUS_RANGE = 500000
+# Tooltip fields shipped per point alongside position, color and radius
+MAP_TOOLTIP_FIELDS = ['FullName', 'NSC', 'Overall_Score', 'Monthly_Total_Budget']
+# ~1 m at the equator; keeps positions short in the JSON payload
+COORDINATE_DECIMALS = 5
+
+def score_colors(scores):
+    """RGBA uint8 array (n x 4) for an array of scores."""
+    scores = np.asarray(scores, dtype='float64')
+    band = np.select([scores >= bound for bound, _ in SCORE_BANDS], np.arange(len(SCORE_BANDS)), default=len(SCORE_BANDS))
+    colors = np.empty((len(scores), 4), dtype=np.uint8)
+    np.take(SCORE_PALETTE, band, axis=0, out=colors)
+    return colors
+
+def budget_radii(budgets):
+    budgets = np.asarray(budgets, dtype='float64')
+    max_budget = budgets.max() if len(budgets) else 0
+    scale = budgets / max_budget if max_budget > 0 else np.zeros_like(budgets)
+    return np.rint(scale * RADIUS_RANGE + MIN_RADIUS).astype(np.int32)
+
+def map_records(data):
+    """Point records for the ScatterplotLayer, built column-wise.
+
+    Each record holds only what the layer and tooltip read: position, color,
+    radius and MAP_TOOLTIP_FIELDS, with numbers rounded to short JSON.
+    """
+    columns = {
+        'position': np.column_stack([data['lng'].to_numpy('float64'), data['lat'].to_numpy('float64')])
+                    .round(COORDINATE_DECIMALS).tolist(),
+        'color': score_colors(data['Overall_Score']).tolist(),
+        'radius': budget_radii(data['Monthly_Total_Budget']).tolist(),
+        'FullName': data['FullName'].astype(str).tolist(),
+        'NSC': data['NSC'].astype(str).tolist(),
+        'Overall_Score': data['Overall_Score'].to_numpy('float64').round(2).tolist(),
+        'Monthly_Total_Budget': np.rint(data['Monthly_Total_Budget'].to_numpy('float64')).astype(np.int64).tolist(),
+    }
+    names = list(columns)
+    return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+class CompactDeck(pdk.Deck):
+    # pydeck pretty-prints with sorted keys; compact separators cut the payload by about a third
+    def to_json(self):
+        return json.dumps(self, default=default_serialize, separators=(',', ':'))
+
+def build_map_deck(current_data):
+    # Records are built from the aggregates, which stay shared with the cube untouched
+    layer = pdk.Layer(
+        "ScatterplotLayer",
+        map_records(current_data),
+        get_position="position",
+        get_color="color",
+        get_radius="radius",
+        pickable=True,
+        opacity=0.8,
+        filled=True,
+        stroked=True,
+        get_line_color=[255, 255, 255],
+        line_width_min_pixels=2,
+    )
+
+    view_state = pdk.ViewState(latitude=20, longitude=10, zoom=1.5, pitch=0)
+    tooltip = {"html": "<b>{FullName} ({NSC})</b><br>Score: <b>{Overall_Score:.1f}</b><br>Budget: ${Monthly_Total_Budget:,.0f}"}
+    return CompactDeck(layers=[layer], initial_view_state=view_state, tooltip=tooltip, map_style="light")
+
+def build_bin_deck(bins):
+    # Server-side bins arrive as polygons; the browser only draws and picks them
+    colors = score_colors(bins['Score']).tolist()
+    records = [
+        {'polygon': polygon, 'color': color, 'Count': count, 'Score': score}
+        for polygon, color, count, score in zip(
+            [polygon.tolist() for polygon in bins['Polygon']], colors,
+            bins['Count'].tolist(), bins['Score'].round(2).tolist(),
+        )
+    ]
+    layer = pdk.Layer(
+        "PolygonLayer",
+        records,
+        get_polygon="polygon",
+        get_fill_color="color",
+        get_line_color=[255, 255, 255],
+        line_width_min_pixels=1,
+        pickable=True,
+        opacity=0.7,
+        filled=True,
+        stroked=True,
+    )
+
+    view_state = pdk.ViewState(latitude=20, longitude=10, zoom=1.5, pitch=0)
+    tooltip = {"html": "<b>{Count} dealers</b><br>Avg score: <b>{Score}</b>"}
+    return CompactDeck(layers=[layer], initial_view_state=view_state, tooltip=tooltip, map_style="light")
+
+# Market table columns, in display order (sorted by Overall_Score, best first)
+HEATMAP_COLUMNS = ['FullName', 'NSC', 'Monthly_Total_Budget'] + [
+    'Performance & Coverage', 'Quality Excellence', 'Data Infrastructure', 'AI Adoption', 'Overall_Score'
+]
+
+def heatmap_table(current_data):
+    return current_data[HEATMAP_COLUMNS].sort_values('Overall_Score', ascending=False)
+
+def kpi_cards(stats, region):
+    """Label, value, delta text and delta colour of the four KPI cards."""
+    comparison = stats['comparison']
+    deltas = {card: changes.get(comparison) for card, changes in stats['deltas'].items()}
+
+    def performer_delta(card):
+        score = f"Score: {stats[card]['Overall_Score']:.1f}"
+        if deltas[card] is None:
+            return score
+        return f"{deltas[card]:+.1f} pts {comparison} · {score}"
+
+    avg_delta = None if deltas['avg_score'] is None else f"{deltas['avg_score']:+.1f}% {comparison}"
+    budget_delta = None if deltas['total_budget'] is None else f"{deltas['total_budget']:+.1f}% {comparison}"
+    return [
+        {'label': f"{region if region != 'All' else 'Global'} Avg Score", 'value': f"{stats['avg_score']:.1f}",
+         'delta': avg_delta, 'delta_color': 'normal'},
+        {'label': "Top Performer", 'value': str(stats['top_performer']['NSC']),
+         'delta': performer_delta('top_performer'), 'delta_color': 'normal'},
+        {'label': "Needs Attention", 'value': str(stats['worst_performer']['NSC']),
+         'delta': performer_delta('worst_performer'),
+         'delta_color': 'inverse' if deltas['worst_performer'] is None else 'normal'},
+        {'label': "Total Media Budget", 'value': f"${stats['total_budget']/1_000_000:.1f}M",
+         'delta': budget_delta, 'delta_color': 'normal'},
+    ]
+
+def build_gap_figure(current_data, avg_score):
+    gap_df = current_data[['NSC', 'Overall_Score']].copy()
+    gap_df['Gap'] = gap_df['Overall_Score'] - avg_score
+    gap_df['Color'] = gap_df['Gap'].apply(lambda x: '#002c5f' if x >= 0 else '#ef4444')
+    gap_df = gap_df.sort_values('Gap')
+
+    fig_gap = go.Figure()
+    fig_gap.add_trace(go.Bar(
+        y=gap_df['NSC'], x=gap_df['Gap'], orientation='h', marker_color=gap_df['Color'], text=gap_df['Gap'].apply(lambda x: f"{x:+.1f}")
+    ))
+    fig_gap.update_layout(title=f"Divergence from Avg ({avg_score:.1f})", margin=dict(l=0, r=0, t=40, b=0), height=400)
+    return fig_gap
+
+# Above this many points per trace, draw straight WebGL lines without markers
+TREND_DETAIL_POINTS = 200
+
+def build_trend_figure(trend_data):
+    multi = 'Series' in trend_data and trend_data['Series'].nunique() > 1
+    detailed = len(trend_data) <= TREND_DETAIL_POINTS * (trend_data['Series'].nunique() if multi else 1)
+    fig_trend = px.line(
+        trend_data, x='Date', y='Framework_Score', color='Series' if multi else None,
+        markers=detailed, line_shape='spline' if detailed else 'linear',
+        render_mode='auto' if detailed else 'webgl',
+    )
+    if multi:
+        fig_trend.update_traces(line_width=2)
+    else:
+        fig_trend.update_traces(line_color='#002c5f', line_width=3)
+    fig_trend.update_layout(yaxis=dict(range=[40, 100]), plot_bgcolor='white')
+    fig_trend.update_xaxes(showgrid=False)
+    fig_trend.update_yaxes(showgrid=True, gridcolor='#f1f5f9')
+    return fig_trend
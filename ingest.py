@@ -0,0 +1,153 @@
+"""Incremental ingestion of monthly data drops into the columnar store.
+
+Each file in the drop directory holds one or more NSC-months in the raw
+dataset schema (CSV, Parquet or Arrow IPC). A JSON manifest next to the store
+records every processed file, so a sync only parses files that are new or
+whose contents changed. Ingested rows replace any stored rows for the same
+(NSC, Year, Month), which makes re-delivered files safe to drop again.
+
+    python ingest.py drops/ data/sem.parquet
+    python ingest.py drops/ data/sem.parquet --watch 60
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+import datastore
+
+# Rows are replaced per NSC-month
+PERIOD_KEYS = ['NSC', 'Year', 'Month']
+DROP_SUFFIXES = datastore.CSV_SUFFIXES + datastore.PARQUET_SUFFIXES + datastore.ARROW_SUFFIXES
+
+
+@dataclass
+class IngestResult:
+    files: list = field(default_factory=list)
+    rows: pd.DataFrame = None
+    periods: list = field(default_factory=list)
+
+    @property
+    def empty(self):
+        return self.rows is None or self.rows.empty
+
+
+def manifest_path_for(store_path):
+    return f"{store_path}.manifest.json"
+
+
+def load_manifest(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_manifest(path, manifest):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def scan_drop_directory(drop_dir, manifest):
+    """Return [(name, path, fingerprint)] for files not yet ingested as-is."""
+    pending = []
+    for name in sorted(os.listdir(drop_dir)):
+        path = os.path.join(drop_dir, name)
+        if not os.path.isfile(path) or not name.lower().endswith(DROP_SUFFIXES):
+            continue
+        stat = os.stat(path)
+        fingerprint = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+        seen = manifest.get(name)
+        if seen and all(seen.get(k) == v for k, v in fingerprint.items()):
+            continue
+        fingerprint['sha256'] = _sha256(path)
+        if seen and seen.get('sha256') == fingerprint['sha256']:
+            # Touched but unchanged: only refresh the recorded stat
+            seen.update(fingerprint)
+            continue
+        pending.append((name, path, fingerprint))
+    return pending
+
+
+def upsert_periods(stored, increment):
+    """Replace the NSC-months present in `increment`, keeping the latest file's rows."""
+    if stored is None or stored.empty:
+        return increment.reset_index(drop=True)
+    keys = pd.MultiIndex.from_frame(increment[PERIOD_KEYS])
+    replaced = pd.MultiIndex.from_frame(stored[PERIOD_KEYS]).isin(keys)
+    return pd.concat([stored[~replaced], increment], ignore_index=True)
+
+
+def ingest_drop_directory(drop_dir, store_path, manifest_path=None):
+    """Parse new/changed drop files and upsert them into the store at `store_path`."""
+    if os.path.isdir(store_path):
+        # Upserts rewrite the store as one file; partitioned directories are read-only here
+        raise ValueError(f"Ingest needs a single Parquet/Arrow store file, not a partitioned directory: {store_path}")
+    manifest_path = manifest_path or manifest_path_for(store_path)
+    manifest = load_manifest(manifest_path)
+    recorded = json.dumps(manifest, sort_keys=True)
+    pending = scan_drop_directory(drop_dir, manifest)
+    result = IngestResult()
+
+    if pending:
+        frames = []
+        for order, (name, path, fingerprint) in enumerate(pending):
+            frame = datastore.read_dataset(path)
+            frame['_order'] = order
+            frames.append(frame)
+            result.files.append(name)
+            manifest[name] = dict(fingerprint, rows=len(frame), ingested_at=time.time())
+
+        increment = pd.concat(frames, ignore_index=True)
+        # When several new files carry the same NSC-month, the last one wins
+        latest = increment.groupby(PERIOD_KEYS)['_order'].transform('max')
+        increment = increment[increment['_order'] == latest].drop(columns='_order').reset_index(drop=True)
+
+        stored = datastore.read_dataset(store_path) if os.path.exists(store_path) else None
+        if stored is not None:
+            increment = increment[[c for c in stored.columns if c in increment.columns]]
+        datastore.write_dataset(upsert_periods(stored, increment), store_path)
+
+        result.rows = increment
+        result.periods = sorted(set(zip(increment['Year'].astype(int), increment['Month'].astype(int))))
+
+    # Also saved for touched-but-unchanged files, so they aren't re-hashed next time
+    if json.dumps(manifest, sort_keys=True) != recorded:
+        save_manifest(manifest_path, manifest)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ingest monthly SEM data drops into the columnar store.")
+    parser.add_argument('drop_dir', help="Directory receiving monthly drop files")
+    parser.add_argument('store', help="Target .parquet or .arrow dataset")
+    parser.add_argument('--watch', type=float, metavar='SECONDS', help="Keep polling at this interval")
+    args = parser.parse_args(argv)
+    if os.path.isdir(args.store):
+        parser.error("store must be a single .parquet or .arrow file, not a partitioned directory")
+
+    while True:
+        result = ingest_drop_directory(args.drop_dir, args.store)
+        if not result.empty:
+            print(f"Ingested {len(result.rows)} rows from {len(result.files)} file(s); periods {result.periods}")
+        if args.watch is None:
+            break
+        time.sleep(args.watch)
+
+
+if __name__ == '__main__':
+    main()
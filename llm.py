@@ -0,0 +1,262 @@
+"""LLM backends for the AI Strategy Consultant.
+
+Every backend exposes the same blocking `generate` and streaming `stream`
+calls and records a CallTiming per call: time spent waiting for a
+concurrency slot (queue), time to first token and total time. Besides
+Gemini there is an offline StubBackend with configurable latency and token
+rate that returns deterministic text, so the consultant path can be
+exercised and benchmarked without a key or network:
+
+    python llm.py --backend stub --calls 50 --concurrency 4 --latency 0.3 --token-rate 80
+"""
+import argparse
+import hashlib
+import json
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+
+# Environment variable selecting the default backend ('gemini' or 'stub')
+BACKEND_ENV = 'SEM_AI_BACKEND'
+DEFAULT_MODEL = 'gemini-2.5-flash'
+
+
+@dataclass
+class CallTiming:
+    backend: str
+    model: str
+    mode: str
+    queue_time: float
+    time_to_first_token: float = None
+    total_time: float = None
+    output_chars: int = 0
+    completed: bool = False
+
+
+class LLMBackend:
+    name = None
+
+    def __init__(self, model, max_concurrency=None, history=1000):
+        self.model = model
+        self._slots = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        self.timings = deque(maxlen=history)
+        self._local = threading.local()
+
+    @property
+    def last_timing(self):
+        # Per thread, so concurrent sessions each see their own latest call
+        return getattr(self._local, 'timing', None)
+
+    def _record(self, timing):
+        self.timings.append(timing)
+        self._local.timing = timing
+
+    @property
+    def cache_id(self):
+        # Distinguishes cached responses per backend and model
+        return f"{self.name}:{self.model}"
+
+    def _acquire(self):
+        started = time.perf_counter()
+        if self._slots is not None:
+            self._slots.acquire()
+        return started, time.perf_counter() - started
+
+    def _release(self):
+        if self._slots is not None:
+            self._slots.release()
+
+    def generate(self, prompt, schema=None):
+        """Return the full response text (JSON text when `schema` is given)."""
+        started, queue_time = self._acquire()
+        timing = CallTiming(self.name, self.model, 'generate', queue_time)
+        try:
+            text = self._generate(prompt, schema)
+            timing.output_chars = len(text)
+            timing.completed = True
+            return text
+        finally:
+            timing.total_time = time.perf_counter() - started
+            timing.time_to_first_token = timing.total_time if timing.completed else None
+            self._record(timing)
+            self._release()
+
+    def stream(self, prompt):
+        """Yield response text chunks as they are produced."""
+        started, queue_time = self._acquire()
+        timing = CallTiming(self.name, self.model, 'stream', queue_time)
+        try:
+            for chunk in self._stream(prompt):
+                if not chunk:
+                    continue
+                if timing.time_to_first_token is None:
+                    timing.time_to_first_token = time.perf_counter() - started
+                timing.output_chars += len(chunk)
+                yield chunk
+            timing.completed = True
+        finally:
+            # Also reached when the consumer closes the generator early
+            timing.total_time = time.perf_counter() - started
+            self._record(timing)
+            self._release()
+
+    def _generate(self, prompt, schema):
+        raise NotImplementedError
+
+    def _stream(self, prompt):
+        raise NotImplementedError
+
+
+class GeminiBackend(LLMBackend):
+    name = 'gemini'
+
+    def __init__(self, model=DEFAULT_MODEL, api_key=None, **kwargs):
+        super().__init__(model, **kwargs)
+        import google.generativeai as genai
+
+        if api_key:
+            genai.configure(api_key=api_key)
+        self._genai = genai
+
+    def _generate(self, prompt, schema):
+        generation_config = None
+        if schema is not None:
+            generation_config = self._genai.GenerationConfig(
+                response_mime_type="application/json", response_schema=schema
+            )
+        model = self._genai.GenerativeModel(self.model, generation_config=generation_config)
+        return model.generate_content(prompt).text
+
+    def _stream(self, prompt):
+        model = self._genai.GenerativeModel(self.model)
+        for chunk in model.generate_content(prompt, stream=True):
+            # A chunk without text parts (e.g. safety-blocked) raises ValueError
+            try:
+                text = chunk.text
+            except ValueError:
+                continue
+            if text:
+                yield text
+
+
+STUB_WORDS = (
+    "market coverage quality budget adoption gap score region growth plan "
+    "search bidding audience keyword conversion investment benchmark priority"
+).split()
+
+
+class StubBackend(LLMBackend):
+    """Offline backend: fixed first-token latency, then `token_rate` tokens/s.
+
+    Output is derived from a hash of the prompt, so identical prompts always
+    produce identical text.
+    """
+    name = 'stub'
+
+    def __init__(self, model='stub', latency=0.5, token_rate=50.0, response_tokens=120, chunk_tokens=5, **kwargs):
+        super().__init__(model, **kwargs)
+        self.latency = latency
+        self.token_rate = token_rate
+        self.response_tokens = response_tokens
+        self.chunk_tokens = chunk_tokens
+
+    def _words(self, prompt, salt=''):
+        seed = hashlib.sha256(f"{salt}{prompt}".encode('utf-8')).digest()
+        return [STUB_WORDS[seed[i % len(seed)] % len(STUB_WORDS)] for i in range(self.response_tokens)]
+
+    def _chunks(self, words):
+        time.sleep(self.latency)
+        for start in range(0, len(words), self.chunk_tokens):
+            if start and self.token_rate:
+                time.sleep(self.chunk_tokens / self.token_rate)
+            yield " ".join(words[start:start + self.chunk_tokens]) + " "
+
+    def _generate(self, prompt, schema):
+        if schema is None:
+            return "".join(self._chunks(self._words(prompt))).strip()
+        # One deterministic string per required field; pays latency once
+        fields = schema.get('required') or list(schema.get('properties', {}))
+        time.sleep(self.latency)
+        if self.token_rate:
+            time.sleep(len(fields) * self.response_tokens / self.token_rate)
+        return json.dumps({field: " ".join(self._words(prompt, field)) for field in fields})
+
+    def _stream(self, prompt):
+        yield from self._chunks(self._words(prompt))
+
+
+BACKENDS = {'gemini': GeminiBackend, 'stub': StubBackend}
+
+
+def get_backend(name, **kwargs):
+    try:
+        backend_cls = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown LLM backend: {name!r} (expected one of {sorted(BACKENDS)})")
+    return backend_cls(**kwargs)
+
+
+def summarize_timings(timings):
+    """Percentile summary (seconds) of recorded CallTimings."""
+    def percentiles(values):
+        values = sorted(v for v in values if v is not None)
+        if not values:
+            return None
+        pick = lambda q: values[min(len(values) - 1, int(q * len(values)))]
+        return {'p50': pick(0.50), 'p95': pick(0.95), 'max': values[-1]}
+
+    timings = list(timings)
+    return {
+        'calls': len(timings),
+        'completed': sum(t.completed for t in timings),
+        'queue_time': percentiles(t.queue_time for t in timings),
+        'time_to_first_token': percentiles(t.time_to_first_token for t in timings),
+        'total_time': percentiles(t.total_time for t in timings),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure consultant LLM call latency.")
+    parser.add_argument('--backend', default='stub', choices=sorted(BACKENDS))
+    parser.add_argument('--model', help="Model name (backend default if omitted)")
+    parser.add_argument('--api-key', help="Gemini API key")
+    parser.add_argument('--calls', type=int, default=20)
+    parser.add_argument('--concurrency', type=int, default=1, help="Concurrent callers")
+    parser.add_argument('--max-inflight', type=int, help="Backend concurrency limit (adds queue time)")
+    parser.add_argument('--mode', choices=['stream', 'generate'], default='stream')
+    parser.add_argument('--latency', type=float, default=0.5, help="Stub first-token latency (s)")
+    parser.add_argument('--token-rate', type=float, default=50.0, help="Stub tokens per second")
+    parser.add_argument('--output', help="Write per-call timings and the summary as JSON here")
+    args = parser.parse_args(argv)
+
+    kwargs = {'max_concurrency': args.max_inflight}
+    if args.model:
+        kwargs['model'] = args.model
+    if args.backend == 'stub':
+        kwargs.update(latency=args.latency, token_rate=args.token_rate)
+    else:
+        kwargs['api_key'] = args.api_key
+    backend = get_backend(args.backend, **kwargs)
+
+    def call(i):
+        prompt = f"Benchmark prompt {i}: summarize SEM maturity."
+        if args.mode == 'stream':
+            for _ in backend.stream(prompt):
+                pass
+        else:
+            backend.generate(prompt)
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(call, range(args.calls)))
+
+    summary = summarize_timings(backend.timings)
+    print(json.dumps(summary, indent=2))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'summary': summary, 'calls': [asdict(t) for t in backend.timings]}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+"""Memory report for concurrent dashboard sessions.
+
+Runs app.py in-process for a growing number of simulated sessions
+(streamlit's AppTest; like the server, every session in the process shares
+one st.cache_resource dataset) and reruns each through a rotation of region
+filters and the date-range mode. After every step it records traced Python
+memory and resident set size, along with how many DataFrames the size of
+the dataset are alive. With the dataset held once and filtered through
+masks and column selections, that count stays at one. Growth per added
+session is then the session's own widget and output state, a small
+constant however large the dataset:
+
+    python memreport.py --sessions 1 10 20 40 --reruns 4
+    SEM_DATASET_PATH=data/sem.parquet python memreport.py --output memreport.json
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import pandas as pd
+
+import engine
+
+APP_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app.py')
+RUN_TIMEOUT_SECONDS = 300
+
+
+def current_rss():
+    # Resident set size now (not the peak); None where /proc is unavailable
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        return None
+
+
+def live_frames():
+    gc.collect()
+    return [obj for obj in gc.get_objects() if isinstance(obj, pd.DataFrame)]
+
+
+def dataset_copies(shape):
+    """Live DataFrames with the dataset's shape (the shared frame counts as one)."""
+    return sum(1 for frame in live_frames() if frame.shape == shape)
+
+
+def _widget(widgets, label):
+    return next(w for w in widgets if w.label == label)
+
+
+def rerun_session(session, regions, reruns):
+    # Same rotation in every session: new sessions only hit the shared caches
+    for i in range(reruns):
+        _widget(session.toggle, "Date range").set_value(i % 2 == 1)
+        _widget(session.selectbox, "Region").select(regions[i % len(regions)])
+        session.run()
+        if session.exception:
+            raise RuntimeError(f"App raised: {session.exception[0].value}")
+
+
+def session_report(steps, reruns):
+    """Memory after each session count in `steps` (ascending).
+
+    Returns (dataset footprint, rows, traced bytes per added session).
+    """
+    from streamlit.testing.v1 import AppTest
+
+    sessions = []
+
+    def open_session():
+        session = AppTest.from_file(APP_SCRIPT, default_timeout=RUN_TIMEOUT_SECONDS).run()
+        if session.exception:
+            raise RuntimeError(f"App raised: {session.exception[0].value}")
+        sessions.append(session)
+        return session
+
+    # The first session loads the dataset and warms the shared caches; tracing
+    # starts afterwards so the baseline is the shared state alone
+    open_session()
+    # The loaded dataset is the largest frame in the process
+    df = max(live_frames(), key=len)
+    dataset = engine.memory_footprint(df)
+    regions = ['All'] + sorted(df['Region'].astype(str).unique().tolist())
+    shape = df.shape
+    del df
+    rerun_session(sessions[0], regions, reruns)
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+
+    rows = []
+    for target in steps:
+        while len(sessions) < target:
+            rerun_session(open_session(), regions, reruns)
+        rows.append({
+            'sessions': len(sessions),
+            'traced_bytes': tracemalloc.get_traced_memory()[0] - baseline,
+            'rss_bytes': current_rss(),
+            'dataset_copies': dataset_copies(shape),
+        })
+    tracemalloc.stop()
+
+    first, last = rows[0], rows[-1]
+    added = last['sessions'] - first['sessions']
+    per_session = (last['traced_bytes'] - first['traced_bytes']) / added if added else None
+    return dataset, rows, per_session
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report dashboard memory as simulated sessions are added.")
+    parser.add_argument('--sessions', nargs='+', type=int, default=[1, 10, 20, 40],
+                        help="Session counts to measure at")
+    parser.add_argument('--reruns', type=int, default=4, help="Filter reruns per session")
+    parser.add_argument('--output', help="Also write the report as JSON here")
+    args = parser.parse_args(argv)
+    steps = sorted(set(args.sessions))
+    if steps[0] < 1:
+        parser.error("session counts must be at least 1")
+
+    started = time.perf_counter()
+    dataset, rows, per_session = session_report(steps, args.reruns)
+
+    print(f"Dataset: {dataset['rows']:,} rows, {dataset['total_bytes'] / 1_000_000:.2f} MB (shared)")
+    print(f"{'sessions':>8}  {'traced MB':>10}  {'RSS MB':>8}  {'dataset copies':>14}")
+    for row in rows:
+        rss = '-' if row['rss_bytes'] is None else f"{row['rss_bytes'] / 1_000_000:.1f}"
+        print(f"{row['sessions']:>8}  {row['traced_bytes'] / 1_000_000:>10.2f}  {rss:>8}  {row['dataset_copies']:>14}")
+    if per_session is not None:
+        print(f"Per added session: {per_session / 1_000:.1f} KB traced")
+    print(f"({time.perf_counter() - started:.1f}s)", file=sys.stderr)
+
+    if args.output:
+        report = {
+            'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'dataset': {'rows': dataset['rows'], 'total_bytes': dataset['total_bytes']},
+            'reruns_per_session': args.reruns,
+            'steps': rows,
+            'per_session_traced_bytes': per_session,
+        }
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {args.output}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+"""Polars lazy backend for the filter aggregation and the trend.
+
+get_aggregated_data's filter -> framework pivot -> monthly budget -> merge ->
+per-market rollup chain is built as one polars LazyFrame plan, so the query
+optimizer pushes the Year/Month predicates and the column projection into the
+file scan and runs every group_by on polars' thread pool (all cores by
+default, POLARS_MAX_THREADS to cap it). A filter and its comparison periods
+share one plan and a single scan, each row tagged with its period. Results
+follow the engine contract: (final_agg, global_stats) with the same columns,
+dtypes and deltas; get_trend_data matches engine.get_trend_data.
+
+polars is optional and only imported when this backend is used:
+
+    python polars_engine.py --dataset data/sem.parquet --year 2025 --month Oct
+    python polars_engine.py --dataset data/sem.parquet --trend --region LATAM
+"""
+import os
+
+import pandas as pd
+
+import datastore
+import engine
+
+SCAN_COLUMNS = ['NSC', 'Region', 'Country', 'Year', 'Month', 'Framework', 'Framework_Score', 'Monthly_Total_Budget']
+LABEL_COLUMNS = ['NSC', 'Region', 'Country', 'Framework']
+
+
+class PolarsEngine:
+    def __init__(self, path=None):
+        import polars as pl
+
+        self._pl = pl
+        self.path = datastore.resolve_dataset_path(path)
+        self._source = self._scan_source().select(SCAN_COLUMNS)
+
+    def _scan_source(self):
+        pl, path = self._pl, self.path
+        if path is None:
+            # Fixture only: a small in-memory frame, there is nothing to push down into
+            return pl.from_pandas(datastore.read_fixture(engine.DATASET_COLUMNS)).lazy()
+        if os.path.isdir(path):
+            return pl.scan_parquet(os.path.join(path, '**', '*.parquet'), hive_partitioning=True)
+        suffix = os.path.splitext(path)[1].lower()
+        if suffix in datastore.PARQUET_SUFFIXES:
+            return pl.scan_parquet(path)
+        if suffix in datastore.ARROW_SUFFIXES:
+            return pl.scan_ipc(path)
+        if suffix in datastore.CSV_SUFFIXES:
+            return pl.scan_csv(path)
+        raise ValueError(f"Unsupported dataset format: {path}")
+
+    def _period_predicate(self, year, quarter, month):
+        pl = self._pl
+        predicate = pl.col('Year') == int(year)
+        # Both apply when both are set, as in engine.filter_mask
+        if month != 'All':
+            predicate &= pl.col('Month') == engine.MONTH_NAMES.index(month) + 1
+        if quarter != 'All':
+            predicate &= pl.col('Month').is_between(3 * int(quarter) - 2, 3 * int(quarter))
+        return predicate
+
+    def _filtered(self, region_filter, predicates=()):
+        pl = self._pl
+        lf = self._source
+        if predicates:
+            lf = lf.filter(pl.any_horizontal(predicates))
+        # Labels as plain strings whatever the file stored them as (dictionary, categorical)
+        lf = lf.with_columns(
+            pl.col(LABEL_COLUMNS).cast(pl.String),
+            pl.col('Framework_Score').cast(pl.Float32),
+        )
+        if region_filter != 'All':
+            lf = lf.filter(pl.col('Region').is_in(engine.raw_region_names(region_filter)))
+        return lf
+
+    def aggregate_plan(self, periods, region_filter):
+        """Per-market framework means and budget sums for several (year, quarter, month)
+        filters as one LazyFrame; Period is the index into `periods`, which must not overlap."""
+        pl = self._pl
+        predicates = [self._period_predicate(*p) for p in periods]
+        period = pl.when(predicates[0]).then(0)
+        for index, predicate in enumerate(predicates[1:], 1):
+            period = period.when(predicate).then(index)
+        filtered = self._filtered(region_filter, predicates).with_columns(period.alias('Period'))
+
+        keys = ['Period', 'NSC', 'Year', 'Month']
+        monthly = filtered.group_by(keys + ['Region', 'Country']).agg(
+            pl.col('Framework_Score').filter(pl.col('Framework') == fw).mean().alias(fw)
+            for fw in engine.FRAMEWORKS
+        )
+        budget = filtered.group_by(keys).agg(pl.col('Monthly_Total_Budget').max())
+        return (
+            monthly.join(budget, on=keys)
+            .group_by(['Period', 'NSC', 'Region', 'Country'])
+            .agg(
+                *(pl.col(fw).mean() for fw in engine.FRAMEWORKS),
+                pl.col('Monthly_Total_Budget').sum(),
+            )
+        )
+
+    def get_aggregated_data(self, year, quarter, month, region_filter, with_deltas=True):
+        """Same contract and result as engine.get_aggregated_data."""
+        periods = [(int(year), quarter, month)]
+        if with_deltas:
+            periods += list(engine.comparison_periods(year, quarter, month).values())
+        # The filter and its comparison periods come from a single scan and plan
+        rollup = self.aggregate_plan(periods, region_filter).collect().to_pandas()
+        results = {
+            period: engine.rollup_aggregate(rollup[rollup['Period'] == index].reset_index(drop=True))
+            for index, period in enumerate(periods)
+        }
+
+        final_agg, global_stats = results[periods[0]]
+        if final_agg is None:
+            return None, None
+        if with_deltas:
+            aggregate = lambda y, q, m, region: results[(int(y), q, m)]
+            deltas = engine.reference_deltas(aggregate, year, quarter, month, region_filter, global_stats)
+            engine.attach_deltas(global_stats, deltas, engine.filter_granularity(quarter, month))
+        return final_agg, global_stats
+
+    def get_trend_data(self, region_filter):
+        """Same result as engine.get_trend_data."""
+        pl = self._pl
+        trend = (
+            self._filtered(region_filter)
+            .group_by(['Year', 'Month', 'NSC'])
+            .agg(pl.col('Framework_Score').mean())
+            .group_by(['Year', 'Month'])
+            .agg(pl.col('Framework_Score').mean())
+            .sort(['Year', 'Month'])
+            .collect()
+            .to_pandas()
+        )
+        trend = trend.astype({'Year': 'int16', 'Month': 'int8', 'Framework_Score': 'float32'})
+        trend['Date'] = pd.to_datetime(trend[['Year', 'Month']].assign(DAY=1))
+        return trend
+
+    def latest_year(self):
+        return int(self._source.select(self._pl.col('Year').max()).collect().item())
+
+    def explain(self, year, quarter, month, region_filter):
+        return self.aggregate_plan([(year, quarter, month)], region_filter).explain()
+
+    def close(self):
+        pass
+
+
+def main(argv=None):
+    parser = engine.backend_parser("Run the filter aggregation or trend through polars.")
+    parser.add_argument('--trend', action='store_true', help="Print the monthly trend instead of aggregates")
+    args = parser.parse_args(argv)
+
+    backend = PolarsEngine(args.dataset)
+    if args.trend:
+        print(backend.get_trend_data(args.region).to_string(index=False))
+        return
+    engine.run_backend_cli(parser, backend, args)
+
+
+if __name__ == '__main__':
+    main()
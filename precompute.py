@@ -0,0 +1,136 @@
+"""Startup precompute of the aggregation cube and trend series on a process pool.
+
+The preprocessed frame is written once as an uncompressed Arrow IPC file
+(under /dev/shm where available, so it never leaves memory) and every worker
+memory-maps it instead of receiving pickled partitions. Tasks carry only a
+partition key: one year of the cube (its prior year is read for the deltas
+baseline, exactly as update_aggregation_cube rebuilds a year) or one
+region's trend series. Small datasets, or a single worker, build serially in
+the calling process, where the pool would cost more than it saves.
+
+    python precompute.py --dataset data/sem.parquet --workers 8
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import types
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+import engine
+
+# Worker processes for the startup precompute (default: all cores)
+WORKERS_ENV = 'SEM_PRECOMPUTE_WORKERS'
+# Below this many rows the serial build beats starting a pool
+PARALLEL_MIN_ROWS = 200_000
+SHARED_MEMORY_DIR = '/dev/shm'
+
+# The memory-mapped dataset, opened once per worker process
+_table = None
+
+
+def precompute_workers(workers=None):
+    workers = workers or os.environ.get(WORKERS_ENV) or os.cpu_count() or 1
+    return max(1, int(workers))
+
+
+def _open_shared(path):
+    global _table
+    import pyarrow as pa
+
+    _table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+
+
+def _rows(column, values):
+    # Rows of the mapped table whose `column` is in `values`, as a preprocessed frame
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    return _table.filter(pc.is_in(_table[column], value_set=pa.array(values))).to_pandas()
+
+
+def _year_cube(year):
+    return engine.build_aggregation_cube(_rows('Year', [year - 1, year]), {year})
+
+
+def _region_trend(region, freq):
+    part = _table.to_pandas() if region == 'All' else _rows('Region', [region])
+    return engine.build_trend_series(part, region, freq)
+
+
+@contextmanager
+def _bare_main():
+    # Streamlit runs the app script as __main__ and spawned workers re-run their
+    # parent's main module on startup; show them an empty one instead
+    main = sys.modules['__main__']
+    sys.modules['__main__'] = types.ModuleType('__main__')
+    try:
+        yield
+    finally:
+        sys.modules['__main__'] = main
+
+
+def _write_shared(df, directory):
+    import pyarrow as pa
+
+    path = os.path.join(directory, 'dataset.arrow')
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return path
+
+
+def precompute(df, trend_freqs=('M',), workers=None):
+    """Build the aggregation cube and per-region trend series for `df`.
+
+    Returns (cube, trends) where trends maps (region, freq) to
+    build_trend_series results for 'All' and every region.
+    """
+    workers = precompute_workers(workers)
+    years = sorted(int(y) for y in df['Year'].unique())
+    regions = ['All'] + sorted(df['Region'].astype(str).unique().tolist())
+    trend_keys = [(region, freq) for freq in trend_freqs for region in regions]
+
+    if workers == 1 or len(df) < PARALLEL_MIN_ROWS:
+        cube = engine.build_aggregation_cube(df)
+        trends = {(region, freq): engine.build_trend_series(df, region, freq) for region, freq in trend_keys}
+        return cube, trends
+
+    shm = SHARED_MEMORY_DIR if os.path.isdir(SHARED_MEMORY_DIR) else None
+    with tempfile.TemporaryDirectory(dir=shm, prefix='sem-precompute-') as directory:
+        path = _write_shared(df, directory)
+        # spawn: forking the server process (and its threads) is not safe
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(workers, mp_context=context, initializer=_open_shared, initargs=(path,)) as pool:
+            # Workers start on submit. Largest tasks first: the all-region
+            # trends, then years newest to oldest
+            with _bare_main():
+                trend_futures = {key: pool.submit(_region_trend, *key) for key in trend_keys}
+                cube_futures = [pool.submit(_year_cube, year) for year in reversed(years)]
+            cube = {}
+            for future in cube_futures:
+                cube.update(future.result())
+            trends = {key: future.result() for key, future in trend_futures.items()}
+    return cube, trends
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time the startup precompute of the cube and trend series.")
+    parser.add_argument('--dataset', help="Parquet/Arrow/CSV dataset (default: $SEM_DATASET_PATH or the fixture)")
+    parser.add_argument('--workers', type=int, help=f"Worker processes (default: ${WORKERS_ENV} or all cores)")
+    parser.add_argument('--freq', nargs='+', choices=engine.TREND_FREQS, default=['M'], help="Trend frequencies to precompute")
+    args = parser.parse_args(argv)
+
+    df = engine.load_and_process_data(args.dataset)
+    started = time.perf_counter()
+    cube, trends = precompute(df, tuple(args.freq), args.workers)
+    seconds = time.perf_counter() - started
+    print(f"{len(df):,} rows -> {len(cube):,} cube entries, {len(trends)} trend series "
+          f"in {seconds:.2f}s with {precompute_workers(args.workers)} worker(s)")
+
+
+if __name__ == '__main__':
+    main()
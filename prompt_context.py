@@ -0,0 +1,88 @@
+"""Compact, size-bounded data context for the AI consultant prompts.
+
+The filtered aggregates are encoded as a rounded TSV table, preceded by
+summary statistics and outliers, so the model sees every framework and the
+budget without the padding of DataFrame.to_string(). When the table would
+exceed the token budget the context degrades in steps: first to region
+rollups plus the top/bottom markets, then to the summary alone.
+"""
+import pandas as pd
+
+DEFAULT_TOKEN_BUDGET = 1500
+# Rough chars-per-token ratio for English/tabular text
+CHARS_PER_TOKEN = 4
+OUTLIER_Z = 1.5
+MAX_OUTLIERS = 10
+EXTREMES = 5
+
+# Source column -> short label used in the prompt
+METRICS = {
+    'Overall_Score': 'Overall',
+    'Performance & Coverage': 'Perf',
+    'Quality Excellence': 'Quality',
+    'Data Infrastructure': 'DataInfra',
+    'AI Adoption': 'AI',
+}
+BUDGET_LABEL = 'Budget_$M'
+
+
+def estimate_tokens(text):
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def _table(data, key):
+    table = data[[key] + list(METRICS)].rename(columns=METRICS)
+    table[list(METRICS.values())] = table[list(METRICS.values())].astype(float).round(1)
+    table[BUDGET_LABEL] = (data['Monthly_Total_Budget'].astype(float) / 1_000_000).round(2)
+    table[key] = table[key].astype(str)
+    return table.to_csv(sep='\t', index=False, lineterminator='\n').strip()
+
+
+def _summary(data):
+    scores = data['Overall_Score'].astype(float)
+    lines = [f"Markets: {len(data)}; total budget ${data['Monthly_Total_Budget'].sum() / 1_000_000:.1f}M"]
+    for column, label in METRICS.items():
+        values = data[column].astype(float)
+        lines.append(
+            f"{label}: mean {values.mean():.1f}, min {values.min():.1f}, max {values.max():.1f}, sd {values.std(ddof=0):.1f}"
+        )
+
+    spread = scores.std(ddof=0)
+    if spread > 0:
+        z = (scores - scores.mean()) / spread
+        flagged_index = z[z.abs() >= OUTLIER_Z].abs().sort_values(ascending=False).index[:MAX_OUTLIERS]
+        flagged = data.loc[flagged_index]
+        if not flagged.empty:
+            outliers = ", ".join(
+                f"{nsc} {score:.1f} ({z_score:+.1f}sd)"
+                for nsc, score, z_score in zip(flagged['NSC'].astype(str), flagged['Overall_Score'], z[flagged.index])
+            )
+            lines.append(f"Overall outliers: {outliers}")
+    return "\n".join(lines)
+
+
+def _region_rollup(data):
+    rollup = data.groupby(data['Region'].astype(str)).agg(
+        {**{column: 'mean' for column in METRICS}, 'Monthly_Total_Budget': 'sum'}
+    ).reset_index()
+    return _table(rollup, 'Region')
+
+
+def _extremes(data):
+    ranked = data.sort_values('Overall_Score', ascending=False)
+    picked = pd.concat([ranked.head(EXTREMES), ranked.tail(EXTREMES)]).drop_duplicates('NSC')
+    return _table(picked, 'NSC')
+
+
+def encode_context(data, token_budget=DEFAULT_TOKEN_BUDGET):
+    """Encode aggregated market rows (one per NSC) within `token_budget` tokens."""
+    summary = "Summary:\n" + _summary(data)
+    candidates = [
+        f"{summary}\nMarkets (TSV):\n{_table(data, 'NSC')}",
+        f"{summary}\nRegions (TSV):\n{_region_rollup(data)}\n"
+        f"Top/bottom {EXTREMES} markets (TSV):\n{_extremes(data)}",
+    ]
+    for context in candidates:
+        if estimate_tokens(context) <= token_budget:
+            return context
+    return summary[:token_budget * CHARS_PER_TOKEN]
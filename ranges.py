@@ -0,0 +1,195 @@
+"""Prefix-sum indexes for arbitrary month-range aggregates.
+
+get_aggregated_data answers calendar filters only (a year, quarter or
+month). For rolling windows and custom start/end months across year
+boundaries, a RangeIndex is built once at load time from the monthly base
+table: per NSC and framework, cumulative sums and counts of the monthly mean
+score over a gap-free month axis, plus cumulative monthly budget and
+Allocated_Cost per NSC. A range aggregate is
+then two lookups and a subtraction per series however many months it spans,
+so the frame is never re-scanned.
+
+Months are indexed as year * 12 + month - 1. Results follow the engine
+contract, (final_agg, global_stats), with an Allocated_Cost column and
+total_cost stat added, and deltas against the preceding range of the same
+length (None when that range reaches before the first indexed month). A
+calendar-aligned range gives the same markets and scores as
+get_aggregated_data:
+
+    python ranges.py --last 6 --region Europe
+    python ranges.py --start 2024-11 --end 2025-04
+"""
+import argparse
+import json
+import sys
+
+import numpy as np
+import pandas as pd
+
+import datastore
+import engine
+
+COST_COLUMN = 'Allocated_Cost'
+# Sidebar presets: trailing windows ending at the latest month with data
+RANGE_PRESETS = {'Last 3 months': 3, 'Last 6 months': 6, 'Last 12 months': 12}
+
+
+def month_index(year, month):
+    return int(year) * 12 + int(month) - 1
+
+
+def month_label(index):
+    return f"{engine.MONTH_NAMES[int(index) % 12]} {int(index) // 12}"
+
+
+def parse_month(text):
+    """'YYYY-MM' -> month index."""
+    year, month = text.split('-')
+    if not 1 <= int(month) <= 12:
+        raise ValueError(f"Month out of range: {text!r}")
+    return month_index(year, month)
+
+
+def range_mask(df, start, end, region_filter='All'):
+    # Rows of the months start..end (inclusive), as a boolean array over `df`
+    months = df['Year'].to_numpy('int32') * 12 + df['Month'].to_numpy('int32') - 1
+    mask = (months >= start) & (months <= end)
+    if region_filter != 'All':
+        mask = mask & (df['Region'] == region_filter).to_numpy()
+    return mask
+
+
+class RangeIndex:
+    def __init__(self, df):
+        base = engine.monthly_base(df)
+        costs = df.groupby(['NSC', 'Year', 'Month'], observed=True)[COST_COLUMN].sum()
+        base = base.merge(costs.reset_index(), on=['NSC', 'Year', 'Month'], how='left')
+
+        period = base['Year'].to_numpy('int64') * 12 + base['Month'].to_numpy('int64') - 1
+        self.first, self.last = int(period.min()), int(period.max())
+        markets = base[engine.GROUP_KEYS].drop_duplicates('NSC').astype({'NSC': str})
+        self._markets = markets.sort_values('NSC', ignore_index=True)
+        self._regions = self._markets['Region'].astype(str).to_numpy()
+
+        rows = pd.Categorical(base['NSC'].astype(str), categories=self._markets['NSC']).codes
+        cols = period - self.first + 1
+        shape = (len(self._markets), self.last - self.first + 2)
+
+        def cumulative(values):
+            # (NSC, month[, series]) grid with a leading zero month, summed along months
+            grid = np.zeros(shape + values.shape[1:])
+            grid[rows, cols] = values
+            return grid.cumsum(axis=1)
+
+        scores = base[engine.FRAMEWORKS].to_numpy('float64')
+        scored = ~np.isnan(scores)
+        self._score_sum = cumulative(np.where(scored, scores, 0.0))
+        self._score_count = cumulative(scored.astype('float64'))
+        self._months = cumulative(np.ones(len(base)))
+        self._budget = cumulative(base['Monthly_Total_Budget'].to_numpy('float64'))
+        self._cost = cumulative(base[COST_COLUMN].fillna(0).to_numpy('float64'))
+
+    def _bounds(self, start, end):
+        # Prefix-array columns of the range, clipped to the indexed months
+        span = self._months.shape[1] - 1
+        return int(np.clip(start - self.first, 0, span)), int(np.clip(end - self.first + 1, 0, span))
+
+    def _aggregate(self, start, end, region_filter):
+        lo, hi = self._bounds(start, end)
+        if hi <= lo:
+            return None, None
+        keep = self._months[:, hi] - self._months[:, lo] > 0
+        if region_filter != 'All':
+            keep &= self._regions == region_filter
+        if not keep.any():
+            return None, None
+
+        window = lambda grid: grid[keep, hi] - grid[keep, lo]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = window(self._score_sum) / window(self._score_count)
+        final_agg = self._markets[keep].reset_index(drop=True)
+        final_agg[engine.FRAMEWORKS] = means.astype('float32')
+        final_agg['Monthly_Total_Budget'] = window(self._budget)
+        final_agg[COST_COLUMN] = window(self._cost)
+        final_agg = final_agg.astype({col: 'category' for col in engine.GROUP_KEYS})
+        final_agg, global_stats = engine.finalize_aggregate(final_agg)
+        global_stats['total_cost'] = final_agg[COST_COLUMN].sum()
+        return final_agg, global_stats
+
+    def trailing(self, months, end=None):
+        """(start, end) of the `months` ending at `end` (default: the latest month).
+
+        The start is clamped to the first indexed month, so the window can be
+        shorter than `months` when the data does not reach back that far.
+        """
+        end = self.last if end is None else end
+        return max(end - months + 1, self.first), end
+
+    def query(self, start, end, region_filter='All', with_deltas=True):
+        """(final_agg, global_stats) for months start..end (inclusive, month indexes)."""
+        final_agg, global_stats = self._aggregate(start, end, region_filter)
+        if final_agg is None or not with_deltas:
+            return final_agg, global_stats
+
+        length = end - start + 1
+        label = f"vs prior {length}M"
+        # A prior window reaching before the data would be clipped and compare
+        # against fewer months, so it gets no deltas
+        prev_agg, prev_stats = None, None
+        if start - length >= self.first:
+            prev_agg, prev_stats = self._aggregate(start - length, start - 1, region_filter)
+        if prev_agg is None:
+            prev_stats, prev_scores = {}, pd.Series(dtype='float64')
+        else:
+            prev_scores = prev_agg.set_index(prev_agg['NSC'].astype(str))['Overall_Score']
+        deltas = {
+            'avg_score': {label: engine.pct_change(global_stats['avg_score'], prev_stats.get('avg_score'))},
+            'total_budget': {label: engine.pct_change(global_stats['total_budget'], prev_stats.get('total_budget'))},
+            'total_cost': {label: engine.pct_change(global_stats['total_cost'], prev_stats.get('total_cost'))},
+        }
+        for card in ('top_performer', 'worst_performer'):
+            performer = global_stats[card]
+            deltas[card] = {label: engine.point_change(performer['Overall_Score'], prev_scores.get(str(performer['NSC'])))}
+        global_stats['deltas'] = deltas
+        global_stats['comparison'] = label
+        global_stats['mom_change'] = None
+        return final_agg, global_stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Aggregate markets over an arbitrary month range.")
+    parser.add_argument('--dataset', help=f"Parquet/Arrow/CSV dataset (default: ${datastore.DATASET_PATH_ENV} or the fixture)")
+    parser.add_argument('--start', help="First month, YYYY-MM")
+    parser.add_argument('--end', help="Last month, YYYY-MM (default: latest month with data)")
+    parser.add_argument('--last', type=int, help="Trailing months ending at --end instead of --start")
+    parser.add_argument('--region', default='All')
+    args = parser.parse_args(argv)
+    if (args.start is None) == (args.last is None):
+        parser.error("give exactly one of --start or --last")
+
+    index = RangeIndex(engine.load_and_process_data(args.dataset))
+    end = parse_month(args.end) if args.end else index.last
+    if args.start:
+        start = parse_month(args.start)
+    else:
+        start, end = index.trailing(args.last, end)
+        if end - start + 1 < args.last:
+            print(f"Data starts {month_label(index.first)}: only {end - start + 1} of the last {args.last} months",
+                  file=sys.stderr)
+    final_agg, stats = index.query(start, end, args.region)
+    if final_agg is None:
+        parser.exit(1, "No data available for the selected range.\n")
+    table = engine.markets_frame(final_agg)
+    table[COST_COLUMN] = final_agg[COST_COLUMN].round(2)
+    record = engine.stats_record(stats)
+    record['total_cost'] = round(float(stats['total_cost']), 2)
+    payload = {
+        'range': {'start': month_label(start), 'end': month_label(end), 'region': args.region},
+        'stats': record,
+        'markets': json.loads(table.to_json(orient='records')),
+    }
+    print(json.dumps(payload, indent=2, default=str))
+
+
+if __name__ == '__main__':
+    main()
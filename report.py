@@ -0,0 +1,238 @@
+"""Headless batch reports: one static page per Region x period.
+
+Each page carries the dashboard's KPI cards, heatmap table, gap analysis and
+trend chart, built by the same figures.py functions. Aggregates and trend
+series are precomputed once for the whole pack (precompute.py, itself
+parallel) and pages render on a process pool, each task receiving only its
+own small slice of results. plotly.js is written once per pack and shared by
+every page, and index.html links them all. With --pdf every page is also
+written as a PDF through plotly's static image export, which needs the
+optional kaleido package:
+
+    python report.py --year 2025 --month Oct --output reports/2025-10
+    python report.py --all-periods --workers 8 --pdf
+"""
+import argparse
+import html
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import plotly.graph_objects as go
+from plotly.offline import get_plotlyjs
+from plotly.subplots import make_subplots
+
+import datastore
+import engine
+import export
+import figures
+import precompute
+
+PLOTLY_JS = 'plotly.min.js'
+INDEX_FILE = 'index.html'
+PDF_SIZE = (1400, 1800)
+
+PAGE_CSS = """
+body { font-family: 'Segoe UI', sans-serif; margin: 24px; color: #1e293b; }
+h1 { color: #002c5f; margin-bottom: 4px; }
+.cards { display: flex; gap: 16px; margin: 16px 0; }
+.card { flex: 1; border: 1px solid #e2e8f0; border-radius: 8px; padding: 12px 16px; }
+.card .label { font-size: 13px; color: #64748b; }
+.card .value { font-size: 28px; font-weight: 600; }
+.card .delta { font-size: 13px; }
+.card .delta.up { color: #16a34a; } .card .delta.down { color: #dc2626; }
+.row { display: flex; gap: 16px; }
+.row > div { flex: 1; min-width: 0; }
+table.markets { border-collapse: collapse; width: 100%; font-size: 13px; }
+table.markets th, table.markets td { border-bottom: 1px solid #e2e8f0; padding: 4px 8px; text-align: right; }
+table.markets th:nth-child(-n+2), table.markets td:nth-child(-n+2) { text-align: left; }
+"""
+
+SCORE_FORMAT = '{:.1f}'.format
+TABLE_FORMATTERS = {'Monthly_Total_Budget': '${:,.0f}'.format}
+TABLE_FORMATTERS.update({col: SCORE_FORMAT for col in figures.HEATMAP_COLUMNS[3:]})
+
+
+def report_periods(df, year, quarter, month, all_periods):
+    """(year, quarter, month) filters of the pack: one period, or every period of the year."""
+    if not all_periods:
+        return [(year, quarter, month)]
+    months = sorted(df.loc[df['Year'] == year, 'Month'].unique().tolist())
+    quarters = sorted({(m - 1) // 3 + 1 for m in months})
+    return (
+        [(year, 'All', 'All')]
+        + [(year, str(q), 'All') for q in quarters]
+        + [(year, 'All', engine.MONTH_NAMES[m - 1]) for m in months]
+    )
+
+
+def _period_title(year, quarter, month):
+    if month != 'All':
+        return f"{month} {year}"
+    if quarter != 'All':
+        return f"Q{quarter} {year}"
+    return str(year)
+
+
+def _card_html(card):
+    delta = card['delta'] or ''
+    direction = ''
+    if delta and delta[0] in '+-':
+        up = delta.startswith('+') != (card['delta_color'] == 'inverse')
+        direction = 'up' if up else 'down'
+    return (
+        f'<div class="card"><div class="label">{html.escape(card["label"])}</div>'
+        f'<div class="value">{html.escape(card["value"])}</div>'
+        f'<div class="delta {direction}">{html.escape(delta)}</div></div>'
+    )
+
+
+def render_html(task):
+    """Standalone page for one report task; plotly.js is loaded from the pack directory."""
+    region, stats, current_data = task['region'], task['stats'], task['current_data']
+    title = f"{region if region != 'All' else 'Global'} · {_period_title(task['year'], task['quarter'], task['month'])}"
+    chart = dict(full_html=False, include_plotlyjs=False, config={'displayModeBar': False})
+    gap = figures.build_gap_figure(current_data, stats['avg_score']).to_html(**chart)
+    trend = figures.build_trend_figure(task['trend_data']).to_html(**chart)
+    table = figures.heatmap_table(current_data).to_html(
+        index=False, classes='markets', border=0, formatters=TABLE_FORMATTERS
+    )
+    cards = ''.join(_card_html(card) for card in figures.kpi_cards(stats, region))
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>SEM Maturity · {html.escape(title)}</title>
+<script src="{PLOTLY_JS}"></script><style>{PAGE_CSS}</style></head>
+<body><h1>SEM Maturity Report</h1><div>{html.escape(title)}</div>
+<div class="cards">{cards}</div>
+<div class="row"><div><h2>📊 Strategy Performance Heatmap</h2>{table}</div><div><h2>📉 Gap Analysis</h2>{gap}</div></div>
+<h2>📈 Maturity Progression (Trend)</h2>{trend}
+</body></html>
+"""
+
+
+def build_pdf_figure(task):
+    """The page as one Plotly figure (KPI table, gap and trend charts, market table) for PDF export."""
+    current_data, stats = task['current_data'], task['stats']
+    fig = make_subplots(
+        rows=3, cols=2, row_heights=[0.08, 0.42, 0.5], vertical_spacing=0.05,
+        specs=[[{'type': 'table', 'colspan': 2}, None], [{}, {}], [{'type': 'table', 'colspan': 2}, None]],
+        subplot_titles=[None, "Gap Analysis", "Maturity Progression (Trend)", None],
+    )
+    cards = figures.kpi_cards(stats, task['region'])
+    fig.add_trace(go.Table(
+        header=dict(values=[card['label'] for card in cards]),
+        cells=dict(values=[[card['value'], card['delta'] or ''] for card in cards]),
+    ), row=1, col=1)
+    for trace in figures.build_gap_figure(current_data, stats['avg_score']).data:
+        fig.add_trace(trace, row=2, col=1)
+    for trace in figures.build_trend_figure(task['trend_data']).data:
+        fig.add_trace(trace, row=2, col=2)
+    table = figures.heatmap_table(current_data)
+    fig.add_trace(go.Table(
+        header=dict(values=list(table.columns)),
+        cells=dict(values=[
+            table[col].map(TABLE_FORMATTERS[col]) if col in TABLE_FORMATTERS else table[col].astype(str)
+            for col in table.columns
+        ]),
+    ), row=3, col=1)
+    title = f"SEM Maturity Report · {task['region']} · {_period_title(task['year'], task['quarter'], task['month'])}"
+    fig.update_layout(title=title, showlegend=False, width=PDF_SIZE[0], height=PDF_SIZE[1])
+    return fig
+
+
+def render_task(task, output_dir, pdf=False):
+    """Write one report page (and PDF); returns the HTML file name."""
+    name = export.export_name(
+        'html', 'report', *export.filter_parts(task['year'], task['quarter'], task['month'], task['region'])
+    )
+    with open(os.path.join(output_dir, name), 'w', encoding='utf-8') as f:
+        f.write(render_html(task))
+    if pdf:
+        build_pdf_figure(task).write_image(os.path.join(output_dir, name[:-len('.html')] + '.pdf'))
+    return name
+
+
+def build_tasks(cube, trends, periods, regions, freq='M', trend_kind='Overall'):
+    # Only each page's own markets, stats and trend points go to its worker
+    tasks = []
+    for year, quarter, month in periods:
+        for region in regions:
+            current_data, stats = engine.lookup_aggregated_data(cube, year, quarter, month, region)
+            if current_data is None:
+                continue
+            tasks.append({
+                'year': year, 'quarter': quarter, 'month': month, 'region': region,
+                'current_data': current_data, 'stats': stats,
+                'trend_data': engine.trend_view(trends[(region, freq)], trend_kind),
+            })
+    return tasks
+
+
+def write_index(output_dir, pages):
+    links = '\n'.join(
+        f'<li><a href="{html.escape(name)}">{html.escape(label)}</a></li>' for label, name in pages
+    )
+    with open(os.path.join(output_dir, INDEX_FILE), 'w', encoding='utf-8') as f:
+        f.write(f'<!DOCTYPE html>\n<html><head><meta charset="utf-8"><title>SEM Maturity Reports</title>'
+                f'<style>{PAGE_CSS}</style></head>\n<body><h1>SEM Maturity Reports</h1><ul>\n{links}\n</ul></body></html>\n')
+
+
+def generate_reports(df, periods, output_dir, workers=None, pdf=False, trend_kind='Overall'):
+    """Render every Region x period page of `periods` into `output_dir`; returns the page count."""
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, PLOTLY_JS), 'w', encoding='utf-8') as f:
+        f.write(get_plotlyjs())
+
+    regions = ['All'] + sorted(df['Region'].astype(str).unique().tolist())
+    cube, trends = precompute.precompute(df, ('M',), workers)
+    tasks = build_tasks(cube, trends, periods, regions, 'M', trend_kind)
+
+    workers = precompute.precompute_workers(workers)
+    if workers == 1 or len(tasks) < 2:
+        names = [render_task(task, output_dir, pdf) for task in tasks]
+    else:
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+            names = list(pool.map(render_task, tasks, [output_dir] * len(tasks), [pdf] * len(tasks)))
+
+    labels = [
+        f"{_period_title(task['year'], task['quarter'], task['month'])} · {task['region']}" for task in tasks
+    ]
+    write_index(output_dir, list(zip(labels, names)))
+    return len(names)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render static dashboard reports for every Region x period.")
+    parser.add_argument('--dataset', help=f"Parquet/Arrow/CSV dataset (default: ${datastore.DATASET_PATH_ENV} or the fixture)")
+    parser.add_argument('--year', type=int, help="Defaults to the latest year in the dataset")
+    parser.add_argument('--quarter', default='All', choices=['All', '1', '2', '3', '4'])
+    parser.add_argument('--month', default=None, choices=['All'] + engine.MONTH_NAMES,
+                        help="Defaults to the latest month of --year (the monthly pack)")
+    parser.add_argument('--all-periods', action='store_true', help="Every year, quarter and month view of --year")
+    parser.add_argument('--trend-kind', choices=engine.TREND_KINDS, default='Overall')
+    parser.add_argument('--workers', type=int, help=f"Render processes (default: ${precompute.WORKERS_ENV} or all cores)")
+    parser.add_argument('--pdf', action='store_true', help="Also write a PDF per page (needs kaleido)")
+    parser.add_argument('--output', default='reports', help="Output directory")
+    args = parser.parse_args(argv)
+
+    if args.pdf:
+        try:
+            import kaleido  # noqa: F401
+        except ImportError:
+            parser.exit(1, "PDF output needs the kaleido package (pip install kaleido).\n")
+
+    df = engine.load_and_process_data(args.dataset)
+    year = args.year if args.year is not None else int(df['Year'].max())
+    month = args.month
+    if month is None:
+        month = 'All' if args.quarter != 'All' else engine.MONTH_NAMES[int(df.loc[df['Year'] == year, 'Month'].max()) - 1]
+    periods = report_periods(df, year, args.quarter, month, args.all_periods)
+
+    started = time.perf_counter()
+    pages = generate_reports(df, periods, args.output, args.workers, args.pdf, args.trend_kind)
+    print(f"Wrote {pages} report pages to {args.output} in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
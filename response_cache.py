@@ -0,0 +1,94 @@
+"""Disk-backed cache for AI consultant responses.
+
+Entries are JSON files named by a hash of (model, prompt type, data context),
+so identical consultations from any session or process are answered from
+disk. Entries older than `ttl` seconds are dropped on read, and the least
+recently used files are evicted once the directory exceeds `max_bytes`.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+
+# Environment variable overriding the cache directory
+CACHE_DIR_ENV = 'SEM_AI_CACHE_DIR'
+DEFAULT_CACHE_DIR = '.ai_cache'
+
+
+def make_key(model, prompt_type, context):
+    payload = json.dumps([model, prompt_type, context], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    def __init__(self, directory=None, ttl=24 * 3600, max_bytes=50_000_000):
+        self.directory = directory or os.environ.get(CACHE_DIR_ENV, DEFAULT_CACHE_DIR)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        if self.ttl is not None and time.time() - entry['created_at'] > self.ttl:
+            self._remove(path)
+            self.misses += 1
+            return None
+        # Bump mtime so size eviction is least-recently-used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return entry['text']
+
+    def put(self, key, text, **metadata):
+        entry = dict(metadata, text=text, created_at=time.time())
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        with self._lock:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+            self._evict()
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.json'):
+                # Entries can vanish mid-scan (TTL expiry in get, another process evicting)
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(os.path.join(self.directory, name))
+            total -= size
+
+    def clear(self):
+        with self._lock:
+            for name in os.listdir(self.directory):
+                if name.endswith('.json'):
+                    self._remove(os.path.join(self.directory, name))
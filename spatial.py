@@ -0,0 +1,185 @@
+"""Server-side spatial binning of dealer-level map points.
+
+Dealer (or city) coordinates are read from the file named by SEM_DEALER_PATH
+with columns NSC, lat and lng, plus an optional per-point Score. Points are
+projected to Web Mercator metres and binned into hexagons or square cells
+sized for a map zoom level, so the browser receives one polygon per occupied
+bin (count and mean score) instead of the raw points:
+
+    python spatial.py data/dealers.parquet --zoom 4 --shape hex
+"""
+import argparse
+import json
+
+import numpy as np
+import pandas as pd
+
+import datastore
+
+# Environment variable pointing at the dealer-level points file
+DEALER_PATH_ENV = 'SEM_DEALER_PATH'
+DEALER_COLUMNS = ['NSC', 'lat', 'lng']
+SCORE_COLUMN = 'Score'
+
+EARTH_RADIUS = 6378137.0
+MAX_LATITUDE = 85.05112878
+# A 256px map tile at zoom z spans 2*pi*R / 2**z metres; aim for bins about 32px across
+BINS_PER_TILE = 8
+SHAPES = ('hex', 'grid')
+MIN_ZOOM, MAX_ZOOM = 1, 14
+COORDINATE_DECIMALS = 5
+
+_SQRT3 = np.sqrt(3.0)
+# Corner offsets in units of the bin size, closed rings
+_HEX_CORNERS = np.array([
+    (np.cos(np.radians(60 * i + 30)), np.sin(np.radians(60 * i + 30))) for i in range(7)
+])
+_GRID_CORNERS = np.array([(-0.5, -0.5), (0.5, -0.5), (0.5, 0.5), (-0.5, 0.5), (-0.5, -0.5)])
+
+
+def load_dealer_points(path):
+    """Read dealer points with NSC as a categorical and float64 coordinates."""
+    try:
+        points = datastore.read_dataset(path, columns=DEALER_COLUMNS + [SCORE_COLUMN])
+    except (KeyError, ValueError):
+        # No Score column: dealers are coloured by their market's score
+        points = datastore.read_dataset(path, columns=DEALER_COLUMNS)
+    points['NSC'] = points['NSC'].astype('category')
+    points['lat'] = points['lat'].astype('float64')
+    points['lng'] = points['lng'].astype('float64')
+    if SCORE_COLUMN in points:
+        points[SCORE_COLUMN] = points[SCORE_COLUMN].astype('float32')
+    return points
+
+
+def bin_size_for_zoom(zoom):
+    """Hexagon radius / grid cell edge in Mercator metres for a map zoom level."""
+    return 2 * np.pi * EARTH_RADIUS / (2 ** float(zoom)) / BINS_PER_TILE
+
+
+def to_mercator(lng, lat):
+    lat = np.clip(lat, -MAX_LATITUDE, MAX_LATITUDE)
+    x = EARTH_RADIUS * np.radians(lng)
+    y = EARTH_RADIUS * np.log(np.tan(np.pi / 4 + np.radians(lat) / 2))
+    return x, y
+
+
+def from_mercator(x, y):
+    lng = np.degrees(x / EARTH_RADIUS)
+    lat = np.degrees(2 * np.arctan(np.exp(y / EARTH_RADIUS)) - np.pi / 2)
+    return lng, lat
+
+
+def _hex_cells(x, y, size):
+    # Pointy-top axial coordinates, rounded through cube coordinates
+    q = (_SQRT3 / 3 * x - y / 3) / size
+    r = (2 / 3 * y) / size
+    s = -q - r
+    rq, rr, rs = np.rint(q), np.rint(r), np.rint(s)
+    dq, dr, ds = np.abs(rq - q), np.abs(rr - r), np.abs(rs - s)
+    fix_q = (dq > dr) & (dq > ds)
+    fix_r = ~fix_q & (dr > ds)
+    rq = np.where(fix_q, -rr - rs, rq)
+    rr = np.where(fix_r, -rq - rs, rr)
+    return rq.astype(np.int64), rr.astype(np.int64)
+
+
+def _hex_centers(q, r, size):
+    return size * _SQRT3 * (q + r / 2), size * 1.5 * r
+
+
+def _grid_cells(x, y, size):
+    return np.floor(x / size).astype(np.int64), np.floor(y / size).astype(np.int64)
+
+
+def _grid_centers(i, j, size):
+    return (i + 0.5) * size, (j + 0.5) * size
+
+
+def bin_points(lng, lat, size, shape='hex', weights=None):
+    """Bin points into cells of `size` Mercator metres.
+
+    Returns a DataFrame with one row per occupied cell: the cell centre
+    (lng/lat), Count, Score (mean of `weights`, NaN where a cell has no
+    scored points) and Polygon, an (n, k, 2) array of lng/lat rings.
+    """
+    if shape not in SHAPES:
+        raise ValueError(f"Unknown bin shape: {shape!r} (expected one of {SHAPES})")
+    lng = np.asarray(lng, dtype='float64')
+    lat = np.asarray(lat, dtype='float64')
+    valid = np.isfinite(lng) & np.isfinite(lat)
+    x, y = to_mercator(lng[valid], lat[valid])
+    cells, centers, corners = (
+        (_hex_cells, _hex_centers, _HEX_CORNERS) if shape == 'hex' else (_grid_cells, _grid_centers, _GRID_CORNERS)
+    )
+    a, b = cells(x, y, size)
+
+    # Pack each cell pair into one int64 so grouping is a single hash factorize;
+    # bincount then does the per-cell sums
+    codes, uniques = pd.factorize((a << 32) + (b & 0xFFFFFFFF))
+    n_bins = len(uniques)
+    counts = np.bincount(codes, minlength=n_bins)
+    scores = np.full(n_bins, np.nan)
+    if weights is not None:
+        weights = np.asarray(weights, dtype='float64')[valid]
+        scored = np.isfinite(weights)
+        score_counts = np.bincount(codes[scored], minlength=n_bins)
+        score_sums = np.bincount(codes[scored], weights=weights[scored], minlength=n_bins)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            scores = np.where(score_counts > 0, score_sums / score_counts, np.nan)
+
+    low = uniques & 0xFFFFFFFF
+    cell_b = np.where(low >= 2 ** 31, low - 2 ** 32, low)
+    cell_a = (uniques - low) >> 32
+    cx, cy = centers(cell_a, cell_b, size)
+    ring_x = cx[:, None] + corners[None, :, 0] * size
+    ring_y = cy[:, None] + corners[None, :, 1] * size
+    ring_lng, ring_lat = from_mercator(ring_x, ring_y)
+    center_lng, center_lat = from_mercator(cx, cy)
+    return pd.DataFrame({
+        'lng': center_lng.round(COORDINATE_DECIMALS),
+        'lat': center_lat.round(COORDINATE_DECIMALS),
+        'Count': counts,
+        'Score': scores,
+        'Polygon': list(np.stack([ring_lng, ring_lat], axis=-1).round(COORDINATE_DECIMALS)),
+    })
+
+
+def dealer_bins(points, market_scores, zoom, shape='hex'):
+    """Bin the dealers of the markets in `market_scores` (NSC -> Overall_Score).
+
+    Points outside those markets (other regions, or no data for the period)
+    are dropped; dealers without their own Score take their market's.
+    """
+    market_scores = pd.Series(market_scores, dtype='float64')
+    score = points['NSC'].map(market_scores).astype('float64').to_numpy()
+    keep = ~np.isnan(score)
+    if SCORE_COLUMN in points:
+        own = points[SCORE_COLUMN].to_numpy('float64')
+        score = np.where(np.isnan(own), score, own)
+    return bin_points(
+        points['lng'].to_numpy()[keep], points['lat'].to_numpy()[keep],
+        bin_size_for_zoom(zoom), shape, weights=score[keep],
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bin dealer-level points into hexagons or grid cells.")
+    parser.add_argument('points', help="Parquet/Arrow/CSV file with NSC, lat, lng (and optional Score)")
+    parser.add_argument('--zoom', type=float, default=4, help="Map zoom level the bins are sized for")
+    parser.add_argument('--shape', choices=SHAPES, default='hex')
+    parser.add_argument('--output', help="Write bin summaries as JSON records here")
+    args = parser.parse_args(argv)
+
+    points = load_dealer_points(args.points)
+    scores = points[SCORE_COLUMN] if SCORE_COLUMN in points else None
+    bins = bin_points(points['lng'], points['lat'], bin_size_for_zoom(args.zoom), args.shape, weights=scores)
+    print(f"{len(points):,} points -> {len(bins):,} {args.shape} bins at zoom {args.zoom:g}")
+    if args.output:
+        records = bins.drop(columns='Polygon').to_dict('records')
+        with open(args.output, 'w') as f:
+            json.dump(records, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+"""DuckDB query backend for the filter aggregation.
+
+Runs get_aggregated_data's filter -> framework pivot -> monthly budget ->
+per-market rollup as one SQL query over the dataset file, so DuckDB pushes
+the Year/Month/Region predicates and the column projection into the Parquet
+(or Arrow) scan and never materializes the full dataset in pandas. A
+directory is read as a Hive-partitioned Parquet dataset (e.g. Year=2025/),
+which also prunes whole partitions. Results follow the engine contract:
+(final_agg, global_stats) with the same columns, dtypes and deltas.
+
+duckdb is optional and only imported when this backend is used:
+
+    python sql_engine.py --dataset data/sem.parquet --year 2025 --month Oct
+"""
+import os
+import threading
+
+import datastore
+import engine
+
+VIEW_NAME = 'sem'
+
+
+def _quote(path):
+    return "'" + path.replace("'", "''") + "'"
+
+
+class DuckDBEngine:
+    def __init__(self, path=None, threads=None):
+        import duckdb
+
+        self.path = datastore.resolve_dataset_path(path)
+        self._con = duckdb.connect(database=':memory:')
+        if threads:
+            self._con.execute(f"SET threads = {int(threads)}")
+        self._register_source()
+        # Registered frames/datasets are only visible on this connection, so
+        # queries share it; DuckDB parallelizes each query internally
+        self._lock = threading.Lock()
+
+    def _register_source(self):
+        path = self.path
+        if path is None:
+            # Fixture only: a small in-memory frame, there is nothing to push down into
+            self._con.register('fixture_raw', datastore.read_fixture(engine.DATASET_COLUMNS))
+            source = 'fixture_raw'
+        elif os.path.isdir(path):
+            source = f"read_parquet({_quote(os.path.join(path, '**', '*.parquet'))}, hive_partitioning = true)"
+        else:
+            suffix = os.path.splitext(path)[1].lower()
+            if suffix in datastore.PARQUET_SUFFIXES:
+                source = f"read_parquet({_quote(path)})"
+            elif suffix in datastore.ARROW_SUFFIXES:
+                # DuckDB pushes projections and filters into Arrow dataset scans
+                import pyarrow.dataset as ds
+
+                self._con.register('arrow_raw', ds.dataset(path, format='ipc'))
+                source = 'arrow_raw'
+            elif suffix in datastore.CSV_SUFFIXES:
+                source = f"read_csv_auto({_quote(path)})"
+            else:
+                raise ValueError(f"Unsupported dataset format: {path}")
+        self._con.execute(f"CREATE VIEW {VIEW_NAME} AS SELECT * FROM {source}")
+
+    def _execute(self, sql, params):
+        with self._lock:
+            return self._con.execute(sql, params).df()
+
+    @staticmethod
+    def _where(year, quarter, month, region_filter):
+        clauses, params = ['Year = ?'], [int(year)]
+        # Both apply when both are set, as in engine.filter_mask (a month
+        # outside the quarter selects nothing)
+        if month != 'All':
+            clauses.append('Month = ?')
+            params.append(engine.MONTH_NAMES.index(month) + 1)
+        if quarter != 'All':
+            clauses.append('Month BETWEEN ? AND ?')
+            params += [3 * int(quarter) - 2, 3 * int(quarter)]
+        if region_filter != 'All':
+            raw = engine.raw_region_names(region_filter)
+            clauses.append(f"Region IN ({', '.join('?' * len(raw))})")
+            params += raw
+        return ' AND '.join(clauses), params
+
+    def query_aggregates(self, year, quarter, month, region_filter):
+        """Per-market framework means and budget sum for one filter, as a raw DataFrame."""
+        where, params = self._where(year, quarter, month, region_filter)
+        pivots = ',\n'.join(
+            f'avg(Framework_Score) FILTER (WHERE Framework = ?) AS "{fw}"' for fw in engine.FRAMEWORKS
+        )
+        rollups = ', '.join(f'avg(m."{fw}") AS "{fw}"' for fw in engine.FRAMEWORKS)
+        sql = f"""
+            WITH filtered AS (
+                SELECT NSC, Region, Country, Year, Month, Framework, Framework_Score, Monthly_Total_Budget
+                FROM {VIEW_NAME}
+                WHERE {where}
+            ),
+            monthly AS (
+                SELECT NSC, Region, Country, Year, Month,
+                {pivots}
+                FROM filtered
+                GROUP BY NSC, Region, Country, Year, Month
+            ),
+            budget AS (
+                SELECT NSC, Year, Month, max(Monthly_Total_Budget) AS Monthly_Total_Budget
+                FROM filtered
+                GROUP BY NSC, Year, Month
+            )
+            SELECT m.NSC, m.Region, m.Country, {rollups}, sum(b.Monthly_Total_Budget) AS Monthly_Total_Budget
+            FROM monthly m JOIN budget b ON m.NSC = b.NSC AND m.Year = b.Year AND m.Month = b.Month
+            GROUP BY m.NSC, m.Region, m.Country
+        """
+        # Placeholders: the WHERE clause first, then one framework per pivot column
+        return self._execute(sql, params + list(engine.FRAMEWORKS))
+
+    def get_aggregated_data(self, year, quarter, month, region_filter, with_deltas=True):
+        """Same contract and result as engine.get_aggregated_data."""
+        final_agg, global_stats = engine.rollup_aggregate(self.query_aggregates(year, quarter, month, region_filter))
+        if final_agg is None:
+            return None, None
+        if with_deltas:
+            aggregate = lambda *filters: self.get_aggregated_data(*filters, with_deltas=False)
+            deltas = engine.reference_deltas(aggregate, year, quarter, month, region_filter, global_stats)
+            engine.attach_deltas(global_stats, deltas, engine.filter_granularity(quarter, month))
+        return final_agg, global_stats
+
+    def latest_year(self):
+        return int(self._execute(f"SELECT max(Year) AS Year FROM {VIEW_NAME}", [])['Year'].iloc[0])
+
+    def explain(self, year, quarter, month, region_filter):
+        where, params = self._where(year, quarter, month, region_filter)
+        sql = f"EXPLAIN SELECT NSC, Framework_Score FROM {VIEW_NAME} WHERE {where}"
+        return '\n'.join(self._execute(sql, params)['explain_value'])
+
+    def close(self):
+        self._con.close()
+
+
+def main(argv=None):
+    parser = engine.backend_parser("Run the filter aggregation through DuckDB.")
+    args = parser.parse_args(argv)
+    engine.run_backend_cli(parser, DuckDBEngine(args.dataset), args)
+
+
+if __name__ == '__main__':
+    main()
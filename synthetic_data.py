@@ -0,0 +1,143 @@
+"""Synthetic SEM maturity datasets in the raw dataset schema.
+
+The first markets reuse the real NSCs from the embedded fixture; further
+markets get generated codes spread across the same regions. Scores follow a
+per-market/framework baseline with a slow drift and noise, budgets are drawn
+per NSC-month, and with `daily=True` every calendar day gets its own rows
+(the monthly budget repeated, as in the source data). generate_dealers
+scatters dealer-level points around each market for the binned map layer.
+
+    python synthetic_data.py data/sem_1m.parquet --nscs 140 --months 60 --daily
+    python synthetic_data.py data/dealers.parquet --nscs 140 --dealers-per-market 10000
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+import datastore
+import engine
+
+EXTRA_FRAMEWORK_TEMPLATE = "Framework {}"
+# Spread of dealers around their market centre, in degrees
+DEALER_SPREAD_DEGREES = 3.0
+
+
+def _markets(nscs):
+    fixture = datastore.read_fixture(['NSC', 'Region', 'Region_Code', 'Country']).drop_duplicates('NSC')
+    markets = fixture.head(nscs).reset_index(drop=True)
+    regions = fixture[['Region', 'Region_Code']].drop_duplicates().reset_index(drop=True)
+    extra = []
+    for i in range(len(markets), nscs):
+        region = regions.iloc[i % len(regions)]
+        extra.append({
+            'NSC': f"NSC{i + 1:04d}",
+            'Region': region['Region'],
+            'Region_Code': region['Region_Code'],
+            'Country': f"Market {i + 1}",
+        })
+    return pd.concat([markets, pd.DataFrame(extra)], ignore_index=True) if extra else markets
+
+
+def _frameworks(count):
+    known = list(datastore.read_fixture(['Framework'])['Framework'].drop_duplicates())
+    return (known + [EXTRA_FRAMEWORK_TEMPLATE.format(i + 1) for i in range(len(known), count)])[:count]
+
+
+def _categorical(values, index):
+    # Expand per-market/framework labels to rows without materializing strings
+    labels = pd.Categorical(values)
+    return pd.Categorical.from_codes(labels.codes[index], categories=labels.categories)
+
+
+def generate_dataset(nscs=12, months=22, frameworks=4, daily=False, start_year=2024, seed=0):
+    """Return a raw-schema DataFrame of nscs x periods x frameworks rows."""
+    rng = np.random.default_rng(seed)
+    markets = _markets(nscs)
+    framework_names = _frameworks(frameworks)
+
+    month_starts = pd.date_range(f"{start_year}-01-01", periods=months, freq='MS')
+    if daily:
+        dates = pd.date_range(month_starts[0], month_starts[-1] + pd.offsets.MonthEnd(0), freq='D')
+    else:
+        dates = month_starts
+    month_index = (dates.year - start_year) * 12 + dates.month - 1
+
+    n_dates, n_markets, n_frameworks = len(dates), len(markets), len(framework_names)
+    shape = (n_dates, n_markets, n_frameworks)
+
+    # Scores: baseline per market/framework + monthly drift + noise, clipped to 0-100
+    baseline = rng.uniform(55, 85, size=(1, n_markets, n_frameworks))
+    drift = rng.normal(0.15, 0.1, size=(1, n_markets, n_frameworks))
+    noise = rng.normal(0, 2.0, size=shape)
+    scores = np.clip(baseline + drift * month_index.to_numpy()[:, None, None] + noise, 0, 100).round(1)
+
+    # Budgets per market-month, repeated across that month's days and frameworks
+    monthly_budget = rng.lognormal(mean=14.0, sigma=0.8, size=(months, n_markets)).round(2)
+    budget = np.broadcast_to(monthly_budget[month_index][:, :, None], shape)
+    allocated = (budget * rng.uniform(0.01, 0.5, size=shape)).round(2)
+
+    date_idx, market_idx, framework_idx = (a.ravel() for a in np.indices(shape, dtype=np.int32))
+
+    return pd.DataFrame({
+        'Date': dates[date_idx],
+        'Year': dates.year.to_numpy()[date_idx].astype('int16'),
+        'Month': dates.month.to_numpy()[date_idx].astype('int8'),
+        'Region': _categorical(markets['Region'], market_idx),
+        'Region_Code': _categorical(markets['Region_Code'], market_idx),
+        'Country': _categorical(markets['Country'], market_idx),
+        'NSC': _categorical(markets['NSC'], market_idx),
+        'Framework': _categorical(framework_names, framework_idx),
+        'Framework_Score': scores.ravel(),
+        'Monthly_Total_Budget': budget.ravel(),
+        'Allocated_Cost': allocated.ravel(),
+    })
+
+
+def generate_dealers(nscs=12, dealers_per_market=100, seed=0):
+    """Return dealer points (NSC, lat, lng) clustered around each market.
+
+    Fixture markets are centred on their known coordinates; generated ones on
+    a random land-ish latitude band.
+    """
+    rng = np.random.default_rng(seed)
+    markets = _markets(nscs)['NSC'].astype(str)
+    centres = np.array([
+        (engine.COORDINATES[nsc]['lat'], engine.COORDINATES[nsc]['lng']) if nsc in engine.COORDINATES
+        else (rng.uniform(-40, 60), rng.uniform(-150, 150))
+        for nsc in markets
+    ])
+    market_idx = np.repeat(np.arange(len(markets), dtype=np.int32), dealers_per_market)
+    offsets = rng.normal(0, DEALER_SPREAD_DEGREES, size=(len(market_idx), 2))
+    return pd.DataFrame({
+        'NSC': _categorical(markets, market_idx),
+        'lat': np.clip(centres[market_idx, 0] + offsets[:, 0], -85, 85),
+        'lng': (centres[market_idx, 1] + offsets[:, 1] + 180) % 360 - 180,
+    })
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic SEM maturity dataset.")
+    parser.add_argument('dest', help="Target .parquet or .arrow file")
+    parser.add_argument('--nscs', type=int, default=12)
+    parser.add_argument('--months', type=int, default=22)
+    parser.add_argument('--frameworks', type=int, default=4)
+    parser.add_argument('--daily', action='store_true', help="One row per day instead of per month")
+    parser.add_argument('--start-year', type=int, default=2024)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--dealers-per-market', type=int, help="Write dealer points instead of the dataset")
+    args = parser.parse_args(argv)
+
+    if args.dealers_per_market:
+        points = generate_dealers(args.nscs, args.dealers_per_market, args.seed)
+        datastore.write_dataset(points, args.dest)
+        print(f"Wrote {len(points):,} dealer points to {args.dest}")
+        return
+
+    df = generate_dataset(args.nscs, args.months, args.frameworks, args.daily, args.start_year, args.seed)
+    datastore.write_dataset(df, args.dest)
+    print(f"Wrote {len(df):,} rows to {args.dest}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Equivalence of the optional query backends with the pandas path.
+
+Every fixture filter combination (year x quarter x month x region, including
+month/quarter pairs that select nothing) goes through each backend and
+engine.get_aggregated_data, and the results must agree under
+engine.aggregates_match; trends are compared with engine.trends_match.
+Each backend reads the fixture three ways: in memory, as a Parquet file and
+as a Hive-partitioned directory (Year=.../), so the Parquet scans, partition
+columns and predicate pushdown are checked too. A backend whose optional
+package is not installed is skipped:
+
+    python -m pytest -q test_backends.py
+"""
+import os
+
+import pytest
+
+import datastore
+import engine
+
+QUARTERS = ['All', '1', '2', '3', '4']
+MONTHS = ['All'] + engine.MONTH_NAMES
+BACKENDS = {'duckdb': 'duckdb', 'polars': 'polars'}
+SOURCES = ['fixture', 'parquet', 'hive']
+
+
+@pytest.fixture(scope='module')
+def df():
+    return engine.load_and_process_data()
+
+
+@pytest.fixture(scope='module', params=SOURCES)
+def source(request, tmp_path_factory):
+    # Dataset path the backend reads (None: the in-memory fixture)
+    if request.param == 'fixture':
+        return None
+    raw = datastore.read_fixture(engine.DATASET_COLUMNS)
+    root = tmp_path_factory.mktemp(request.param)
+    if request.param == 'parquet':
+        path = os.path.join(root, 'sem.parquet')
+        datastore.write_dataset(raw, path)
+        return path
+    # Year lives only in the directory names, as in a Hive-partitioned store
+    for year, part in raw.groupby('Year'):
+        datastore.write_dataset(part.drop(columns='Year'), os.path.join(root, f"Year={year}", 'part.parquet'))
+    return str(root)
+
+
+@pytest.fixture(scope='module', params=list(BACKENDS))
+def backend(request, source):
+    pytest.importorskip(BACKENDS[request.param])
+    opened = engine.open_backend(request.param, source)
+    yield opened
+    opened.close()
+
+
+def _regions(df):
+    return ['All'] + sorted(df['Region'].astype(str).unique().tolist())
+
+
+@pytest.mark.parametrize('month', MONTHS)
+@pytest.mark.parametrize('quarter', QUARTERS)
+def test_aggregates_match_pandas(df, backend, quarter, month):
+    for year in sorted(int(y) for y in df['Year'].unique()):
+        for region in _regions(df):
+            expected = engine.get_aggregated_data(df, year, quarter, month, region)
+            actual = backend.get_aggregated_data(year, quarter, month, region)
+            ok, reason = engine.aggregates_match(expected, actual)
+            assert ok, f"{year} Q{quarter} {month} {region}: {reason}"
+
+
+def test_inconsistent_quarter_and_month_select_nothing(df, backend):
+    year = int(df['Year'].max())
+    assert engine.get_aggregated_data(df, year, '1', 'Oct', 'All') == (None, None)
+    assert backend.get_aggregated_data(year, '1', 'Oct', 'All') == (None, None)
+
+
+def test_trend_matches_pandas(df, backend):
+    if not hasattr(backend, 'get_trend_data'):
+        pytest.skip("backend has no trend query")
+    for region in _regions(df):
+        ok, reason = engine.trends_match(engine.get_trend_data(df, region), backend.get_trend_data(region))
+        assert ok, f"{region}: {reason}"
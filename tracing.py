@@ -0,0 +1,67 @@
+"""Per-rerun timing spans for the dashboard script.
+
+A RerunTrace collects named spans (wall time of each dashboard section)
+plus tags such as the active filters and cache hit/miss status. Finished
+traces can be appended to a JSON Lines file, one record per rerun:
+
+    {"session": "...", "rerun": 3, "total_ms": 41.2, "tags": {...},
+     "spans": [{"name": "aggregate", "start_ms": 2.1, "duration_ms": 0.4}, ...]}
+"""
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+# Environment variable naming the JSONL trace file (tracing to disk is off when unset)
+TRACE_FILE_ENV = 'SEM_TRACE_FILE'
+
+_write_lock = threading.Lock()
+
+
+class RerunTrace:
+    def __init__(self, session=None, rerun=None):
+        self.session = session
+        self.rerun = rerun
+        self.timestamp = time.time()
+        self.tags = {}
+        self.spans = []
+        self.finished = False
+        self._started = time.perf_counter()
+
+    def _elapsed_ms(self):
+        return (time.perf_counter() - self._started) * 1000
+
+    @contextmanager
+    def span(self, name, **tags):
+        start_ms = self._elapsed_ms()
+        record = {'name': name, 'start_ms': start_ms, 'duration_ms': None}
+        record.update(tags)
+        self.spans.append(record)
+        try:
+            yield record
+        finally:
+            record['duration_ms'] = self._elapsed_ms() - start_ms
+
+    def tag(self, **tags):
+        self.tags.update(tags)
+
+    def to_record(self):
+        return {
+            'session': self.session,
+            'rerun': self.rerun,
+            'timestamp': self.timestamp,
+            'total_ms': self._elapsed_ms(),
+            'tags': self.tags,
+            'spans': self.spans,
+        }
+
+    def finish(self):
+        self.finished = True
+        return self.to_record()
+
+
+def append_trace(path, record):
+    line = json.dumps(record, default=str)
+    with _write_lock:
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(line + '\n')